@@ -0,0 +1,8 @@
+"""
+Allows running the MOTIF CLI as `python -m motif`
+"""
+
+from motif.motif_cli import main
+
+# main() raises SystemExit itself on failure, so returning normally exits 0
+main()
@@ -5,66 +5,369 @@ Entry point for the MOTIF programming language
 """
 
 import sys
-import os
-from motif.parser import interpret_motif
 
 
-def main():
+_USAGE_TEXT = """\
+Usage: motif <script.motif>
+       motif --daemon
+       motif --help
+"""
+
+_HELP_TEXT = """\
+MOTIF: The First AI-Native Musical Programming Language
+
+Usage:
+  motif <script.motif>    Execute a MOTIF script
+  motif --daemon         Keep the interpreter loaded and serve scripts
+                         (used by clients run with MOTIF_DAEMON=1)
+  motif --help           Show this help message
+
+Examples:
+  motif examples/basic_despair.motif
+  motif examples/ml_enhanced_nostalgia.motif
+
+For more information, visit: https://github.com/your-repo/motif
+"""
+
+_ERR_NOTFOUND = "Error: File '%s' not found\n"
+_ERR_PERM = "Error: Permission denied reading '%s'\n"
+
+# Pre-encoded banners written straight to fd 1, bypassing TextIOWrapper
+_BANNER = b"=" * 60 + b"\n"
+_OK = "✅ MOTIF execution completed successfully!\n".encode("utf-8")
+
+
+# Bump whenever parse_motif() output can differ for the same source,
+# including lexer changes to token values, so stale .motifc files are ignored
+_AST_CACHE_VERSION = 2
+
+
+def _read_script(script_path: str) -> tuple:
+    """Read a script with one open, one fstat and reads sized to the file
+
+    Returns the decoded source together with the stat result it was read at.
+    Pipes, FIFOs and /dev/stdin report a size of 0 and os.read() may return
+    short, so reading continues until end of file.
+    """
+    import os
+    fd = os.open(script_path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        size = max(st.st_size, 65536)
+        chunks: list[bytes] = []
+        while True:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        data = b"".join(chunks)
+    finally:
+        os.close(fd)
+    # Decoded in one shot from bytes; drop a UTF-8 BOM left by some editors
+    if data[:3] == b'\xef\xbb\xbf':
+        data = data[3:]
+    return data.decode('utf-8'), st
+
+
+def _load_cached_ast(script_path: str, st):
+    """Return the AST cached in <script>.motifc if it matches the script"""
+    import marshal
+    import stat
+    # Only regular files have an mtime and size that identify their content;
+    # pipes and device files such as /dev/stdin are never cached
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    try:
+        with open(script_path + "c", "rb") as f:
+            version, mtime_ns, size, ast = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (version, mtime_ns, size) != (_AST_CACHE_VERSION, st.st_mtime_ns, st.st_size):
+        return None
+    return ast
+
+
+def _store_cached_ast(script_path: str, st, ast) -> None:
+    """Atomically write the parsed AST next to the script as <script>.motifc"""
+    import marshal
+    import os
+    import stat
+    if not stat.S_ISREG(st.st_mode):
+        return
+    cache_path = script_path + "c"
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump((_AST_CACHE_VERSION, st.st_mtime_ns, st.st_size, ast), f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        # The cache is best-effort: read-only directories just skip it
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _log_handler(stream):
+    """Attach a handler printing MOTIF interpreter messages to stream
+    
+    The interpreter reports progress through the "motif" loggers; the CLI
+    shows those messages as plain lines, as print() used to.
+    """
+    import logging
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    motif_logger = logging.getLogger("motif")
+    motif_logger.setLevel(logging.INFO)
+    motif_logger.addHandler(handler)
+    return handler
+
+
+# Seconds a daemon client may stall while sending its request before the
+# single-threaded accept loop drops it
+_DAEMON_CLIENT_TIMEOUT = 10.0
+
+
+def _socket_path(create: bool = False):
+    """Location of the daemon's Unix socket, or None if it is not safe to use
+
+    Without XDG_RUNTIME_DIR the socket lives in a per-user 0700 directory
+    under the temp dir rather than the shared temp dir itself, where another
+    user could plant or hijack it. That directory is made when create is
+    true and rejected unless it is owned by and private to this user.
+    """
+    import os
+    import stat
+    import tempfile
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "motif.sock")
+    runtime_dir = os.path.join(tempfile.gettempdir(), f"motif-{os.getuid()}")
+    if create:
+        try:
+            os.mkdir(runtime_dir, 0o700)
+        except FileExistsError:
+            pass
+    try:
+        st = os.lstat(runtime_dir)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        return None
+    return os.path.join(runtime_dir, "motif.sock")
+
+
+def _recv_all(conn) -> bytes:
+    """Read from a socket until the peer closes its write side"""
+    chunks: list[bytes] = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def _serve_daemon() -> None:
+    """Keep the parser loaded and execute scripts sent over a Unix socket"""
+    import io
+    import json
+    import logging
+    import os
+    import socket
+    import stat
+    from contextlib import redirect_stdout
+    from motif.parser import interpret_motif
+    
+    sock_path = _socket_path(create=True)
+    if sock_path is None:
+        sys.stderr.write("Error: no private directory for the MOTIF daemon socket\n")
+        raise SystemExit(1)
+    
+    # Only a socket no daemon answers on is stale and safe to replace
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(sock_path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        if not stat.S_ISSOCK(os.lstat(sock_path).st_mode):
+            sys.stderr.write(f"Error: '{sock_path}' exists and is not a socket\n")
+            raise SystemExit(1)
+        os.unlink(sock_path)
+    else:
+        sys.stderr.write(f"Error: a MOTIF daemon is already listening on {sock_path}\n")
+        raise SystemExit(1)
+    finally:
+        probe.close()
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(sock_path)
+    server.listen()
+    print(f"🎵 MOTIF daemon listening on {sock_path}")
+    
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                # A stalled client must not block the single-threaded loop
+                conn.settimeout(_DAEMON_CLIENT_TIMEOUT)
+                output = io.StringIO()
+                handler = _log_handler(output)
+                try:
+                    request = json.loads(_recv_all(conn))
+                    if not isinstance(request, dict) or not isinstance(request.get("code"), str):
+                        raise ValueError('request must be a JSON object with a string "code"')
+                    with redirect_stdout(output):
+                        result = interpret_motif(request["code"])
+                    reply = {"output": output.getvalue(), "result": result}
+                except Exception as e:
+                    reply = {"output": output.getvalue(), "error": str(e)}
+                finally:
+                    logging.getLogger("motif").removeHandler(handler)
+                try:
+                    conn.sendall(json.dumps(reply, default=str).encode("utf-8"))
+                except OSError:
+                    # The client went away or timed out; serve the next one
+                    pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(sock_path)
+
+
+def _run_via_daemon(motif_code: str):
+    """Execute a script on a running daemon, or return None if none is listening"""
+    import json
+    import socket
+    
+    sock_path = _socket_path()
+    if sock_path is None:
+        return None
+    
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(sock_path)
+    except OSError:
+        client.close()
+        return None
+    
+    with client:
+        client.sendall(json.dumps({"code": motif_code}).encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        return json.loads(_recv_all(client))
+
+
+def _report_error(e: BaseException) -> None:
+    """Print an execution error with its traceback"""
+    sys.stdout.flush()
+    sys.stderr.write(f"❌ Error executing MOTIF script: {e}\n")
+    import traceback
+    traceback.print_exc()
+
+
+def main() -> None:
     """Main entry point for the motif command"""
     if len(sys.argv) < 2:
-        print("Usage: motif <script.motif>")
-        print("       motif --help")
-        sys.exit(1)
+        sys.stderr.write(_USAGE_TEXT)
+        raise SystemExit(1)
+    
+    if sys.argv[1] in ("--help", "-h"):
+        sys.stdout.write(_HELP_TEXT)
+        raise SystemExit(0)
+    
+    if sys.argv[1] == "--daemon":
+        _serve_daemon()
+        raise SystemExit(0)
     
-    if sys.argv[1] == "--help" or sys.argv[1] == "-h":
-        print("MOTIF: The First AI-Native Musical Programming Language")
-        print()
-        print("Usage:")
-        print("  motif <script.motif>    Execute a MOTIF script")
-        print("  motif --help           Show this help message")
-        print()
-        print("Examples:")
-        print("  motif examples/basic_despair.motif")
-        print("  motif examples/ml_enhanced_nostalgia.motif")
-        print()
-        print("For more information, visit: https://github.com/your-repo/motif")
-        sys.exit(0)
+    script_path: str = sys.argv[1]
     
-    script_path = sys.argv[1]
+    # Only the execute path needs os; --help and usage import just sys
+    import io
+    import os
     
-    # Check if file exists
-    if not os.path.exists(script_path):
-        print(f"Error: File '{script_path}' not found")
-        sys.exit(1)
+    # The unbuffered, raw fd 1 and binary-buffer shortcuts below are only
+    # valid for the process's real stdout; a replaced sys.stdout (such as
+    # redirect_stdout or a StringIO capture) gets plain text writes instead
+    real_stdout = sys.stdout
+    if not (isinstance(real_stdout, io.TextIOWrapper) and real_stdout is sys.__stdout__):
+        real_stdout = None
     
     # Read and execute the MOTIF script
+    handler = None
     try:
-        with open(script_path, 'r', encoding='utf-8') as f:
-            motif_code = f.read()
+        motif_code, st = _read_script(script_path)
+        
+        # Errors now go to stderr, so stdout can batch the banner and the
+        # interpreter output instead of flushing on every newline
+        if real_stdout is not None:
+            real_stdout.reconfigure(line_buffering=False)
         
         print(f"🎵 Executing MOTIF script: {script_path}")
-        print("=" * 60)
+        if real_stdout is not None:
+            real_stdout.flush()
+            os.write(1, _BANNER)
+        else:
+            sys.stdout.write(_BANNER.decode("ascii"))
         
-        result = interpret_motif(motif_code)
+        reply = None
+        if os.environ.get("MOTIF_DAEMON") == "1":
+            reply = _run_via_daemon(motif_code)
         
-        print("\n" + "=" * 60)
-        print("✅ MOTIF execution completed successfully!")
+        if reply is None:
+            # Deferred so --help and usage errors never load the parser
+            from motif.parser import parse_motif, interpret_motif_ast
+            handler = _log_handler(sys.stdout)
+            ast = _load_cached_ast(script_path, st)
+            if ast is None:
+                ast = parse_motif(motif_code)
+                _store_cached_ast(script_path, st, ast)
+            result = interpret_motif_ast(ast)
+        else:
+            sys.stdout.write(reply["output"])
+            if "error" in reply:
+                raise RuntimeError(reply["error"])
+            result = reply["result"]
         
-        if result and isinstance(result, dict):
-            print(f"📊 Final result: {result.get('status', 'completed')}")
+        # interpret_motif returns a status dict in practice, so index it directly
+        try:
+            status = result["status"]
+        except (TypeError, KeyError):
+            status = "completed" if result and isinstance(result, dict) else None
         
-    except FileNotFoundError:
-        print(f"Error: File '{script_path}' not found")
-        sys.exit(1)
-    except PermissionError:
-        print(f"Error: Permission denied reading '{script_path}'")
-        sys.exit(1)
+        # Emit the whole success tail as one pre-assembled write
+        tail = b"\n" + _BANNER + _OK
+        if status is not None:
+            tail += f"📊 Final result: {status}\n".encode("utf-8")
+        if real_stdout is not None:
+            real_stdout.flush()
+            real_stdout.buffer.write(tail)
+        else:
+            sys.stdout.write(tail.decode("utf-8"))
+        
+    except OSError as e:
+        import errno
+        if e.errno == errno.ENOENT:
+            sys.stderr.write(_ERR_NOTFOUND % script_path)
+        elif e.errno in (errno.EACCES, errno.EPERM):
+            sys.stderr.write(_ERR_PERM % script_path)
+        else:
+            _report_error(e)
+        raise SystemExit(1)
     except Exception as e:
-        print(f"❌ Error executing MOTIF script: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+        _report_error(e)
+        raise SystemExit(1)
+    finally:
+        # The "motif" logger is process-wide; a handler left behind would
+        # repeat every message of a later main() call and keep writing to
+        # this call's stdout even after it has been replaced
+        if handler is not None:
+            import logging
+            logging.getLogger("motif").removeHandler(handler)
 
 
+# python -m motif is the primary entry point; this keeps the older
+# python -m motif.motif_cli invocation working. main() raises SystemExit
+# itself on failure, so returning normally exits 0
 if __name__ == "__main__":
     main()
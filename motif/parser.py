@@ -4,12 +4,22 @@ Implements a Lisp-like syntax parser for the MOTIF emotional programming languag
 """
 
 import re
-from typing import List, Dict, Any, Union, Optional
+import sys
+import logging
+import functools
+from abc import ABC, abstractmethod
+from array import array
+from itertools import compress
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import ast
 
 
+# Interpreter progress messages; callers opt in by configuring logging
+logger = logging.getLogger(__name__)
+
+
 class TokenType(Enum):
     """Token types for MOTIF language"""
     LPAREN = "("
@@ -24,145 +34,208 @@ class TokenType(Enum):
 @dataclass
 class Token:
     """Token representation"""
+    __slots__ = ('type', 'value', 'offset')
+    
     type: TokenType
     value: str
-    line: int
-    column: int
+    offset: int  # index into the source; see line_column()
+
+
+def line_column(text: str, offset: int) -> Tuple[int, int]:
+    """Return the 1-based (line, column) of an offset into text
+    
+    Only diagnostics need positions, so they are derived on demand
+    instead of being tracked for every token.
+    """
+    line = text.count('\n', 0, offset) + 1
+    column = offset - (text.rfind('\n', 0, offset) + 1) + 1
+    return line, column
+
+
+# Small-int code of each TokenType, as stored in TokenStream.types
+_CODE_TYPES = tuple(TokenType)
+_TYPE_CODES = {token_type: code for code, token_type in enumerate(_CODE_TYPES)}
+_LPAREN = _TYPE_CODES[TokenType.LPAREN]
+_RPAREN = _TYPE_CODES[TokenType.RPAREN]
+_SYMBOL = _TYPE_CODES[TokenType.SYMBOL]
+_STRING = _TYPE_CODES[TokenType.STRING]
+_NUMBER = _TYPE_CODES[TokenType.NUMBER]
+_COMMENT = _TYPE_CODES[TokenType.COMMENT]
+_EOF = _TYPE_CODES[TokenType.EOF]
+
+
+class TokenStream:
+    """Tokens stored column-wise: parallel type codes, values and offsets
+    
+    The parse loops mostly look at token types alone, which a dense array
+    of small ints serves without touching a Token object per step. Token
+    objects are built on demand by token() and to_tokens().
+    """
+    __slots__ = ('types', 'values', 'offsets')
+    
+    def __init__(self, types: array, values: List[str], offsets: array):
+        self.types = types
+        self.values = values
+        self.offsets = offsets
+    
+    @classmethod
+    def from_tokens(cls, tokens: List[Token]) -> 'TokenStream':
+        """Build a stream from Token objects"""
+        return cls(array('b', [_TYPE_CODES[token.type] for token in tokens]),
+                   [token.value for token in tokens],
+                   array('q', [token.offset for token in tokens]))
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def token(self, index: int) -> Token:
+        """Materialize the token at index"""
+        return Token(_CODE_TYPES[self.types[index]], self.values[index], self.offsets[index])
+    
+    def to_tokens(self) -> List[Token]:
+        """Materialize every token"""
+        return list(map(Token, map(_CODE_TYPES.__getitem__, self.types), self.values, self.offsets))
+
+
+# Master token pattern, one named alternative per token kind (tried in order).
+# Leading whitespace is absorbed into each match, so the Python-level loop
+# runs once per token rather than once per token and once per gap; stray
+# characters fall through to SKIP. String bodies use the unrolled form
+# [^"\\]*(?:\\.[^"\\]*)* so runs between escapes are consumed by a single
+# character-class repeat, as comment bodies already are.
+_TOKEN_RE = re.compile(r'''
+    \s*
+    (?:
+        (?P<LPAREN>\()
+      | (?P<RPAREN>\))
+      | (?P<STRING>"[^"\\]*(?:\\.?[^"\\]*)*"?)
+      | (?P<COMMENT>;[^\n]*)
+      | (?P<NUMBER>-[\d.]*|\d[\d.]*)
+      | (?P<SYMBOL>[^\W\d][\w-]*)
+      | (?P<SKIP>.)
+    )
+''', re.VERBOSE | re.DOTALL)
+
+# Type code of each _TOKEN_RE group, indexed by group number (None for SKIP
+# and group 0), so a match is classified by one tuple index on lastindex
+# instead of comparing group names
+_GROUP_NAMES = {index: name for name, index in _TOKEN_RE.groupindex.items()}
+_GROUP_CODES: Tuple[Optional[int], ...] = tuple(
+    _TYPE_CODES[TokenType[name]] if name in TokenType.__members__ else None
+    for name in (_GROUP_NAMES.get(index, "") for index in range(_TOKEN_RE.groups + 1)))
+# The same with COMMENT unmapped: comments carry no meaning, so by default
+# they are matched and dropped like SKIP rather than handed to the parser
+_GROUP_CODES_NO_COMMENTS = tuple(None if code == _COMMENT else code for code in _GROUP_CODES)
+
+
+# Sources shorter than this are memoized by scan_cached()
+_TOKEN_CACHE_MAX_CHARS = 1 << 16
+
+
+def _scan(text: str, keep_comments: bool = False) -> TokenStream:
+    """Scan text into a token stream, ending with an EOF token
+    
+    A single compiled regex scans the source, so each token costs one
+    match in the C regex engine instead of a Python loop per character.
+    """
+    group_codes = _GROUP_CODES if keep_comments else _GROUP_CODES_NO_COMMENTS
+    types = array('b')
+    values: List[str] = []
+    offsets = array('q')
+    add_type = types.append
+    add_value = values.append
+    add_offset = offsets.append
+    intern = sys.intern
+    
+    for match in _TOKEN_RE.finditer(text):
+        # Every alternative is a group, so lastindex is never None here
+        group = match.lastindex or 0
+        code = group_codes[group]
+        if code is None:
+            continue
+        value = match.group(group)
+        if code == _SYMBOL:
+            # Symbols are a small, repeating set: interning makes the
+            # interpreter's dict lookups on them identity comparisons
+            value = intern(value)
+        add_type(code)
+        add_value(value)
+        add_offset(match.start(group))
+    
+    add_type(_EOF)
+    add_value("")
+    add_offset(len(text))
+    return TokenStream(types, values, offsets)
+
+
+@functools.lru_cache(maxsize=128)
+def scan_cached(text: str) -> TokenStream:
+    """Scan text, memoized for sources that are parsed repeatedly
+    
+    The returned stream is shared between callers and must not be mutated.
+    """
+    return _scan(text)
 
 
 class MOTIFLexer:
     """Lexer for MOTIF language with Lisp-like syntax"""
     
-    def __init__(self, text: str):
+    def __init__(self, text: str, keep_comments: bool = False):
         self.text = text
+        self.keep_comments = keep_comments  # emit COMMENT tokens
         self.position = 0
-        self.line = 1
-        self.column = 1
-        self.tokens = []
+        self.tokens: List[Token] = []
+    
+    def scan(self) -> TokenStream:
+        """Tokenize the input text into a column-wise TokenStream"""
+        if len(self.text) < _TOKEN_CACHE_MAX_CHARS and not self.keep_comments:
+            stream = scan_cached(self.text)
+        else:
+            stream = _scan(self.text, self.keep_comments)
+        
+        self.position = len(self.text)
+        return stream
     
     def tokenize(self) -> List[Token]:
         """Tokenize the input text"""
-        while self.position < len(self.text):
-            self._skip_whitespace()
-            if self.position >= len(self.text):
-                break
-            
-            char = self.text[self.position]
-            
-            if char == '(':
-                self._add_token(TokenType.LPAREN, char)
-                self._advance()
-            elif char == ')':
-                self._add_token(TokenType.RPAREN, char)
-                self._advance()
-            elif char == '"':
-                self._tokenize_string()
-            elif char == ';':
-                self._tokenize_comment()
-            elif char.isdigit() or char == '-':
-                self._tokenize_number()
-            elif char.isalpha() or char in '-_':
-                self._tokenize_symbol()
-            else:
-                self._advance()
-        
-        self._add_token(TokenType.EOF, "")
+        self.tokens = self.scan().to_tokens()
         return self.tokens
-    
-    def _skip_whitespace(self):
-        """Skip whitespace characters"""
-        while self.position < len(self.text) and self.text[self.position].isspace():
-            if self.text[self.position] == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
-            self.position += 1
-    
-    def _tokenize_string(self):
-        """Tokenize string literal"""
-        start_pos = self.position
-        self._advance()  # Skip opening quote
-        
-        while self.position < len(self.text) and self.text[self.position] != '"':
-            if self.text[self.position] == '\\':
-                self._advance()  # Skip escape character
-            self._advance()
-        
-        if self.position < len(self.text):
-            self._advance()  # Skip closing quote
-        
-        value = self.text[start_pos:self.position]
-        self._add_token(TokenType.STRING, value)
-        # Position already advanced in the while loop
-    
-    def _tokenize_comment(self):
-        """Tokenize comment"""
-        start_pos = self.position
-        while self.position < len(self.text) and self.text[self.position] != '\n':
-            self._advance()
-        
-        value = self.text[start_pos:self.position]
-        self._add_token(TokenType.COMMENT, value)
-        # Position already advanced in the while loop
-    
-    def _tokenize_number(self):
-        """Tokenize number literal"""
-        start_pos = self.position
-        
-        # Handle negative numbers
-        if self.text[self.position] == '-':
-            self._advance()
-        
-        while (self.position < len(self.text) and 
-               (self.text[self.position].isdigit() or self.text[self.position] == '.')):
-            self._advance()
-        
-        value = self.text[start_pos:self.position]
-        self._add_token(TokenType.NUMBER, value)
-        # Position already advanced in the while loop
-    
-    def _tokenize_symbol(self):
-        """Tokenize symbol"""
-        start_pos = self.position
-        
-        while (self.position < len(self.text) and 
-               (self.text[self.position].isalnum() or 
-                self.text[self.position] in '-_')):
-            self._advance()
-        
-        value = self.text[start_pos:self.position]
-        self._add_token(TokenType.SYMBOL, value)
-        # Position already advanced in the while loop
-    
-    def _add_token(self, token_type: TokenType, value: str):
-        """Add token to the list"""
-        token = Token(token_type, value, self.line, self.column)
-        self.tokens.append(token)
-        # Don't advance here - let the caller handle position
-    
-    def _advance(self):
-        """Advance position"""
-        if self.position < len(self.text):
-            self.position += 1
-            self.column += 1
 
 
 class MOTIFParser:
     """Parser for MOTIF language AST generation"""
     
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: Union[TokenStream, List[Token]], text: Optional[str] = None):
+        if not isinstance(tokens, TokenStream):
+            tokens = TokenStream.from_tokens(tokens)
+        if _COMMENT in tokens.types:
+            # The parse loops assume the lexer's default of no comments
+            keep = [code != _COMMENT for code in tokens.types]
+            tokens = TokenStream(array('b', compress(tokens.types, keep)),
+                                 list(compress(tokens.values, keep)),
+                                 array('q', compress(tokens.offsets, keep)))
+        # The parse loops index tokens directly and stop at EOF, so make
+        # sure the stream ends with one (without mutating a shared stream)
+        if not tokens.types or tokens.types[-1] != _EOF:
+            end = tokens.offsets[-1] + len(tokens.values[-1]) if tokens.types else 0
+            tokens = TokenStream(tokens.types + array('b', [_EOF]),
+                                 tokens.values + [""],
+                                 tokens.offsets + array('q', [end]))
         self.tokens = tokens
+        self.types = tokens.types
+        self.values = tokens.values
+        self.text = text  # source, used only to locate syntax errors
         self.position = 0
     
     def parse(self) -> List[Any]:
         """Parse tokens into AST"""
         expressions = []
+        types = self.types
         
-        while not self._is_at_end():
-            if self._peek().type == TokenType.COMMENT:
-                self._advance()  # Skip comments
-                continue
+        while True:
+            token_type = types[self.position]
+            if token_type == _EOF:
+                break
             
             expr = self._parse_expression()
             if expr is not None:
@@ -172,37 +245,37 @@ class MOTIFParser:
     
     def _parse_expression(self) -> Any:
         """Parse a single expression"""
-        if self._peek().type == TokenType.LPAREN:
+        position = self.position
+        token_type = self.types[position]
+        
+        if token_type == _LPAREN:
             return self._parse_list()
-        elif self._peek().type == TokenType.STRING:
-            return self._parse_string()
-        elif self._peek().type == TokenType.NUMBER:
+        elif token_type == _STRING:
+            self.position = position + 1
+            return self.values[position][1:-1]  # Remove quotes
+        elif token_type == _NUMBER:
             return self._parse_number()
-        elif self._peek().type == TokenType.SYMBOL:
-            return self._parse_symbol()
+        elif token_type == _SYMBOL:
+            self.position = position + 1
+            return self.values[position]
         else:
-            raise SyntaxError(f"Unexpected token: {self._peek().value}")
+            raise SyntaxError(f"Unexpected token: {self.values[position]}")
     
     def _parse_list(self) -> List[Any]:
         """Parse S-expression list"""
         self._consume(TokenType.LPAREN, "Expected '('")
+        types = self.types
         
         elements = []
-        while not self._check(TokenType.RPAREN) and not self._is_at_end():
-            if self._peek().type == TokenType.COMMENT:
-                self._advance()  # Skip comments
-                continue
+        while True:
+            token_type = types[self.position]
+            if token_type == _RPAREN or token_type == _EOF:
+                break
             elements.append(self._parse_expression())
         
         self._consume(TokenType.RPAREN, "Expected ')'")
         return elements
     
-    def _parse_string(self) -> str:
-        """Parse string literal"""
-        token = self._consume(TokenType.STRING, "Expected string")
-        # Remove quotes
-        return token.value[1:-1]
-    
     def _parse_number(self) -> Union[int, float]:
         """Parse number literal"""
         token = self._consume(TokenType.NUMBER, "Expected number")
@@ -214,38 +287,40 @@ class MOTIFParser:
         except ValueError:
             raise SyntaxError(f"Invalid number: {token.value}")
     
-    def _parse_symbol(self) -> str:
-        """Parse symbol"""
-        token = self._consume(TokenType.SYMBOL, "Expected symbol")
-        return token.value
-    
     def _peek(self) -> Token:
         """Peek at current token"""
-        if self.position >= len(self.tokens):
-            return self.tokens[-1] if self.tokens else None
-        return self.tokens[self.position]
+        if self.position >= len(self.types):
+            return self.tokens.token(-1)
+        return self.tokens.token(self.position)
     
     def _advance(self) -> Token:
         """Advance and return previous token"""
         if not self._is_at_end():
             self.position += 1
-        return self.tokens[self.position - 1]
+        return self.tokens.token(self.position - 1)
     
     def _consume(self, token_type: TokenType, message: str) -> Token:
         """Consume token of expected type"""
         if self._check(token_type):
             return self._advance()
-        raise SyntaxError(f"{message} at line {self._peek().line}, column {self._peek().column}")
+        raise SyntaxError(f"{message} at {self._location(self._peek())}")
+    
+    def _location(self, token: Token) -> str:
+        """Describe where a token is, for error messages"""
+        if self.text is None:
+            return f"offset {token.offset}"
+        line, column = line_column(self.text, token.offset)
+        return f"line {line}, column {column}"
     
     def _check(self, token_type: TokenType) -> bool:
         """Check if current token is of expected type"""
         if self._is_at_end():
             return False
-        return self._peek().type == token_type
+        return self.types[self.position] == _TYPE_CODES[token_type]
     
     def _is_at_end(self) -> bool:
         """Check if at end of tokens"""
-        return self.position >= len(self.tokens) or (self.tokens and self.tokens[self.position].type == TokenType.EOF)
+        return self.position >= len(self.types) or self.types[self.position] == _EOF
 
 
 class MOTIFAST:
@@ -253,21 +328,29 @@ class MOTIFAST:
     
     @dataclass
     class DefineArchetype:
+        __slots__ = ('name', 'properties')
+        
         name: str
         properties: Dict[str, Any]
     
     @dataclass
     class DefineImage:
+        __slots__ = ('name', 'sensory_data')
+        
         name: str
         sensory_data: Dict[str, Any]
     
     @dataclass
     class DefineEmotion:
+        __slots__ = ('name', 'properties')
+        
         name: str
         properties: Dict[str, Any]
     
     @dataclass
     class DefineMetaphor:
+        __slots__ = ('name', 'source', 'target', 'properties')
+        
         name: str
         source: str
         target: str
@@ -275,74 +358,158 @@ class MOTIFAST:
     
     @dataclass
     class DefineMotif:
+        __slots__ = ('name', 'components', 'archetypes', 'metaphors')
+        
         name: str
         components: Dict[str, Any]
+        # Stringified values of the archetype/metaphor components, in order
+        archetypes: List[str]
+        metaphors: List[str]
     
     @dataclass
     class DefineLeitmotif:
+        __slots__ = ('name', 'motifs', 'properties')
+        
         name: str
         motifs: List[str]
         properties: Dict[str, Any]
     
     @dataclass
     class DefineComposition:
+        __slots__ = ('name', 'structure')
+        
         name: str
         structure: Dict[str, Any]
     
     @dataclass
     class Compose:
+        __slots__ = ('composition_name',)
+        
         composition_name: str
     
     @dataclass
     class ExecuteMotif:
+        __slots__ = ('motif_name',)
+        
         motif_name: str
     
     @dataclass
     class GenerateEmotion:
+        __slots__ = ('emotion_name', 'intensity')
+        
         emotion_name: str
         intensity: float
     
     @dataclass
     class ApplyMetaphor:
+        __slots__ = ('metaphor_name', 'source', 'target')
+        
         metaphor_name: str
         source: str
         target: str
     
     @dataclass
     class IfEmotionalState:
+        __slots__ = ('condition', 'then_expr', 'else_expr')
+        
         condition: Any
         then_expr: Any
         else_expr: Any
     
     @dataclass
     class WhileEmotionalState:
+        __slots__ = ('condition', 'body')
+        
         condition: Any
         body: List[Any]
     
     @dataclass
     class PredictEmotionalTriggers:
+        __slots__ = ('target_emotion', 'context')
+        
         target_emotion: str
         context: str
     
     @dataclass
     class OptimizeForImpact:
+        __slots__ = ('composition_name', 'target_emotion')
+        
         composition_name: str
         target_emotion: str
     
     @dataclass
     class AnalyzeContext:
+        __slots__ = ('context_types',)
+        
         context_types: List[str]
     
     @dataclass
     class GenerateSeedWords:
+        __slots__ = ('emotion', 'intensity', 'context')
+        
         emotion: str
         intensity: float
         context: str
 
 
+# Strips the quotes and brackets of a stringified list and turns its commas
+# into spaces, in one pass
+_BRACKET_TABLE = str.maketrans({"'": None, "[": None, "]": None, ",": " "})
+
+
 class MOTIFInterpreter:
     """Interpreter for MOTIF language with ML integration"""
     
+    # Operator -> handler method name; bound into self._dispatch per instance
+    _DISPATCH_NAMES = {
+        # Definition operators
+        "define-archetype": "_define_archetype",
+        "define-image": "_define_image",
+        "define-emotion": "_define_emotion",
+        "define-metaphor": "_define_metaphor",
+        "define-motif": "_define_motif",
+        "define-leitmotif": "_define_leitmotif",
+        "define-composition": "_define_composition",
+        "define-context": "_define_context",
+        "define-seed-words": "_define_seed_words",
+        
+        # Execution operators
+        "compose": "_compose",
+        "execute-motif": "_execute_motif",
+        "generate-emotion": "_generate_emotion",
+        "apply-metaphor": "_apply_metaphor",
+        
+        # Control flow
+        "if-emotional-state": "_if_emotional_state",
+        "while-emotional-state": "_while_emotional_state",
+        "listener-state": "_listener_state",
+        
+        # ML integration
+        "predict-emotional-triggers": "_predict_emotional_triggers",
+        "optimize-for-impact": "_optimize_for_impact",
+        "analyze-context": "_analyze_context",
+        "generate-seed-words": "_generate_seed_words",
+    }
+    
+    # Symbol resolution order across the definition namespaces
+    _NAMESPACE_RANK = {
+        "symbols": 0,
+        "archetypes": 1,
+        "emotions": 2,
+        "metaphors": 3,
+        "motifs": 4,
+        "leitmotifs": 5,
+        "compositions": 6,
+    }
+    
+    # Mock listener state (would be more sophisticated in real implementation)
+    _MOCK_STATES = {
+        "melancholy": True,
+        "joy": False,
+        "nostalgia": True,
+        "despair": False
+    }
+    
     def __init__(self):
         self.symbols = {}
         self.archetypes = {}
@@ -352,6 +519,14 @@ class MOTIFInterpreter:
         self.leitmotifs = {}
         self.compositions = {}
         self.context = {}
+        # name -> (namespace rank, value); one lookup resolves any symbol
+        self._ns = {}
+        self._dispatch = {sys.intern(operator): getattr(self, name)
+                          for operator, name in self._DISPATCH_NAMES.items()}
+        # id(node) -> (node, text); the node is kept so a recycled id of a
+        # collected node can never match
+        self._lyrics_cache: Dict[int, Tuple[Any, str]] = {}
+        self._suno_cache: Dict[int, Tuple[Any, str]] = {}
     
     def interpret(self, ast: List[Any]) -> Any:
         """Interpret AST and execute MOTIF program"""
@@ -362,16 +537,62 @@ class MOTIFInterpreter:
         
         return result
     
+    def compile_program(self, ast: List[Any]) -> Callable[[], Any]:
+        """Compile a parsed program into a function that runs it on this interpreter
+        
+        Operator handlers are resolved once, while generating the source, so
+        running the returned function repeatedly skips _evaluate's type tests
+        and the dispatch lookup of every top-level expression. Arguments are
+        emitted as literals and rebuilt on each run.
+        """
+        namespace: Dict[str, Any] = {
+            "_evaluate_list": self._evaluate_list,
+            "_evaluate_symbol": self._evaluate_symbol,
+        }
+        lines = ["def _run():", "    result = None"]
+        
+        for expression in ast:
+            if isinstance(expression, list):
+                if not expression:
+                    call = "None"
+                else:
+                    try:
+                        name = self._DISPATCH_NAMES.get(expression[0])
+                    except TypeError:  # unhashable operator, e.g. a nested list
+                        name = None
+                    if name is None:
+                        # Unknown operators still fail when reached, not here
+                        call = f"_evaluate_list({expression!r})"
+                    else:
+                        namespace[name] = self._dispatch[expression[0]]
+                        call = f"{name}({expression!r})"
+            elif isinstance(expression, str):
+                call = f"_evaluate_symbol({expression!r})"
+            else:
+                call = repr(expression)
+            lines.append(f"    result = {call}")
+        
+        lines.append("    return result")
+        exec(compile("\n".join(lines), "<motif>", "exec"), namespace)
+        return namespace["_run"]
+    
     def _evaluate(self, expression: Any) -> Any:
         """Evaluate a single expression"""
-        if isinstance(expression, list):
-            return self._evaluate_list(expression)
-        elif isinstance(expression, str):
-            return self._evaluate_symbol(expression)
-        elif isinstance(expression, (int, float)):
-            return expression
-        else:
-            return expression
+        match expression:
+            case list():
+                # Known operators go straight to their handler, saving the
+                # _evaluate_list call; it still reports empty/unknown forms
+                if expression and type(operator := expression[0]) is str:
+                    handler = self._dispatch.get(operator)
+                    if handler is not None:
+                        return handler(expression)
+                return self._evaluate_list(expression)
+            case str():
+                return self._evaluate_symbol(expression)
+            case int() | float():
+                return expression
+            case _:
+                return expression
     
     def _evaluate_list(self, expression: List[Any]) -> Any:
         """Evaluate S-expression list"""
@@ -379,132 +600,95 @@ class MOTIFInterpreter:
             return None
         
         operator = expression[0]
-        args = expression[1:]
-        
-        # Definition operators
-        if operator == "define-archetype":
-            return self._define_archetype(args)
-        elif operator == "define-image":
-            return self._define_image(args)
-        elif operator == "define-emotion":
-            return self._define_emotion(args)
-        elif operator == "define-metaphor":
-            return self._define_metaphor(args)
-        elif operator == "define-motif":
-            return self._define_motif(args)
-        elif operator == "define-leitmotif":
-            return self._define_leitmotif(args)
-        elif operator == "define-composition":
-            return self._define_composition(args)
-        elif operator == "define-context":
-            return self._define_context(args)
-        elif operator == "define-seed-words":
-            return self._define_seed_words(args)
         
-        # Execution operators
-        elif operator == "compose":
-            return self._compose(args)
-        elif operator == "execute-motif":
-            return self._execute_motif(args)
-        elif operator == "generate-emotion":
-            return self._generate_emotion(args)
-        elif operator == "apply-metaphor":
-            return self._apply_metaphor(args)
-        
-        # Control flow
-        elif operator == "if-emotional-state":
-            return self._if_emotional_state(args)
-        elif operator == "while-emotional-state":
-            return self._while_emotional_state(args)
-        elif operator == "listener-state":
-            return self._listener_state(args)
-        
-        # ML integration
-        elif operator == "predict-emotional-triggers":
-            return self._predict_emotional_triggers(args)
-        elif operator == "optimize-for-impact":
-            return self._optimize_for_impact(args)
-        elif operator == "analyze-context":
-            return self._analyze_context(args)
-        elif operator == "generate-seed-words":
-            return self._generate_seed_words(args)
-        
-        else:
+        try:
+            handler = self._dispatch.get(operator)
+        except TypeError:  # unhashable operator, e.g. a nested list
+            handler = None
+        if handler is None:
             raise RuntimeError(f"Unknown operator: {operator}")
+        # Handlers index the whole form (operands from 1), sparing a slice
+        return handler(expression)
     
     def _evaluate_symbol(self, symbol: str) -> Any:
         """Evaluate symbol reference"""
-        if symbol in self.symbols:
-            return self.symbols[symbol]
-        elif symbol in self.archetypes:
-            return self.archetypes[symbol]
-        elif symbol in self.emotions:
-            return self.emotions[symbol]
-        elif symbol in self.metaphors:
-            return self.metaphors[symbol]
-        elif symbol in self.motifs:
-            return self.motifs[symbol]
-        elif symbol in self.leitmotifs:
-            return self.leitmotifs[symbol]
-        elif symbol in self.compositions:
-            return self.compositions[symbol]
-        else:
+        entry = self._ns.get(symbol)
+        if entry is None:
             return symbol  # Return as literal
-    
-    def _define_archetype(self, args: List[Any]) -> Any:
+        return entry[1]
+    
+    def _store(self, namespace: str, name: Any, value: Any) -> None:
+        """Store a definition in its namespace dict and the unified symbol table"""
+        # Names from the lexer are interned already; those from
+        # compile_program() literals or hand-built ASTs may not be
+        if type(name) is str:
+            name = sys.intern(name)
+        getattr(self, namespace)[name] = value
+        # A name defined in several namespaces resolves to the earliest one
+        # in _NAMESPACE_RANK, as the per-namespace lookups used to
+        rank = self._NAMESPACE_RANK[namespace]
+        entry = self._ns.get(name)
+        if entry is None or entry[0] >= rank:
+            self._ns[name] = (rank, value)
+        # Song text also depends on the leitmotifs and motifs a composition
+        # names, so any redefinition of those invalidates it
+        if namespace in ("motifs", "leitmotifs", "compositions"):
+            self._suno_cache.clear()
+    
+    def _define_archetype(self, expression: List[Any]) -> Any:
         """Define archetype"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-archetype requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         properties = {}
         
         # Parse properties
-        for i in range(1, len(args), 2):
-            if i + 1 < len(args):
-                prop_name = args[i]
-                prop_value = args[i + 1]
+        for i in range(2, len(expression), 2):
+            if i + 1 < len(expression):
+                prop_name = expression[i]
+                prop_value = expression[i + 1]
                 # Handle list keys properly
                 if isinstance(prop_name, list):
                     prop_name = str(prop_name)
                 properties[prop_name] = prop_value
         
         archetype = MOTIFAST.DefineArchetype(name, properties)
-        self.archetypes[name] = archetype
+        self._store("archetypes", name, archetype)
         return archetype
     
-    def _define_image(self, args: List[Any]) -> Any:
+    def _define_image(self, expression: List[Any]) -> Any:
         """Define image"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-image requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         sensory_data = {}
         
         # Parse sensory data
-        for i in range(1, len(args), 2):
-            if i + 1 < len(args):
-                sense = args[i]
-                data = args[i + 1]
+        for i in range(2, len(expression), 2):
+            if i + 1 < len(expression):
+                sense = expression[i]
+                data = expression[i + 1]
                 sensory_data[sense] = data
         
         image = MOTIFAST.DefineImage(name, sensory_data)
-        self.symbols[name] = image
+        self._store("symbols", name, image)
         return image
     
-    def _define_emotion(self, args: List[Any]) -> Any:
+    def _define_emotion(self, expression: List[Any]) -> Any:
         """Define emotion"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-emotion requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         properties = {}
         
         # Parse properties
-        for i in range(1, len(args), 2):
-            if i + 1 < len(args):
-                prop_name = args[i]
-                prop_value = args[i + 1]
+        for i in range(2, len(expression), 2):
+            if i + 1 < len(expression):
+                prop_name = expression[i]
+                prop_value = expression[i + 1]
                 # Handle case where prop_name is a list
                 if isinstance(prop_name, list) and len(prop_name) > 0:
                     prop_name_str = prop_name[0]
@@ -513,24 +697,24 @@ class MOTIFInterpreter:
                     properties[prop_name] = prop_value
         
         emotion = MOTIFAST.DefineEmotion(name, properties)
-        self.emotions[name] = emotion
+        self._store("emotions", name, emotion)
         return emotion
     
-    def _define_metaphor(self, args: List[Any]) -> Any:
+    def _define_metaphor(self, expression: List[Any]) -> Any:
         """Define metaphor"""
-        if len(args) < 3:
+        if len(expression) < 4:
             raise RuntimeError("define-metaphor requires name, source, and target")
         
-        name = args[0]
-        source = args[1]
-        target = args[2]
+        name = expression[1]
+        source = expression[2]
+        target = expression[3]
         properties = {}
         
         # Parse properties
-        for i in range(3, len(args), 2):
-            if i + 1 < len(args):
-                prop_name = args[i]
-                prop_value = args[i + 1]
+        for i in range(4, len(expression), 2):
+            if i + 1 < len(expression):
+                prop_name = expression[i]
+                prop_value = expression[i + 1]
                 # Handle case where prop_name is a list
                 if isinstance(prop_name, list) and len(prop_name) > 0:
                     prop_name_str = prop_name[0]
@@ -539,45 +723,61 @@ class MOTIFInterpreter:
                     properties[prop_name] = prop_value
         
         metaphor = MOTIFAST.DefineMetaphor(name, source, target, properties)
-        self.metaphors[name] = metaphor
+        self._store("metaphors", name, metaphor)
         return metaphor
     
-    def _define_motif(self, args: List[Any]) -> Any:
+    def _define_motif(self, expression: List[Any]) -> Any:
         """Define motif"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-motif requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         components = {}
         
         # Parse components
-        for i in range(1, len(args), 2):
-            if i + 1 < len(args):
-                comp_name = args[i]
-                comp_value = args[i + 1]
+        for i in range(2, len(expression), 2):
+            if i + 1 < len(expression):
+                comp_name = expression[i]
+                comp_value = expression[i + 1]
                 # Handle list values properly - convert to string if needed
                 if isinstance(comp_name, list):
                     comp_name = str(comp_name)
                 components[comp_name] = comp_value
         
-        motif = MOTIFAST.DefineMotif(name, components)
-        self.motifs[name] = motif
+        # Classify the components once here rather than on every lyric build
+        archetypes: List[str] = []
+        metaphors: List[str] = []
+        for key, value in components.items():
+            key = str(key).lower()
+            if 'archetype' in key:
+                target = archetypes
+            elif 'metaphor' in key:
+                target = metaphors
+            else:
+                continue
+            if isinstance(value, list):
+                target.extend([str(v) for v in value])
+            else:
+                target.append(str(value))
+        
+        motif = MOTIFAST.DefineMotif(name, components, archetypes, metaphors)
+        self._store("motifs", name, motif)
         return motif
     
-    def _define_leitmotif(self, args: List[Any]) -> Any:
+    def _define_leitmotif(self, expression: List[Any]) -> Any:
         """Define leitmotif"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-leitmotif requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         motifs = []
         properties = {}
         
         # Parse motifs and properties
-        for i in range(1, len(args), 2):
-            if i + 1 < len(args):
-                key = args[i]
-                value = args[i + 1]
+        for i in range(2, len(expression), 2):
+            if i + 1 < len(expression):
+                key = expression[i]
+                value = expression[i + 1]
                 # Handle case where key is a list (e.g., (motifs ...))
                 if isinstance(key, list) and len(key) > 0:
                     key_name = key[0]
@@ -592,22 +792,22 @@ class MOTIFInterpreter:
                         properties[key] = value
         
         leitmotif = MOTIFAST.DefineLeitmotif(name, motifs, properties)
-        self.leitmotifs[name] = leitmotif
+        self._store("leitmotifs", name, leitmotif)
         return leitmotif
     
-    def _define_composition(self, args: List[Any]) -> Any:
+    def _define_composition(self, expression: List[Any]) -> Any:
         """Define composition"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-composition requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         structure = {}
         
         # Parse structure
-        for i in range(1, len(args), 2):
-            if i + 1 < len(args):
-                key = args[i]
-                value = args[i + 1]
+        for i in range(2, len(expression), 2):
+            if i + 1 < len(expression):
+                key = expression[i]
+                value = expression[i + 1]
                 # Handle case where key is a list (e.g., (leitmotif name))
                 if isinstance(key, list) and len(key) > 0:
                     key_name = key[0]
@@ -620,35 +820,43 @@ class MOTIFInterpreter:
                     structure[key] = value
         
         composition = MOTIFAST.DefineComposition(name, structure)
-        self.compositions[name] = composition
+        self._store("compositions", name, composition)
         return composition
     
-    def _compose(self, args: List[Any]) -> Any:
+    def _compose(self, expression: List[Any]) -> Any:
         """Execute composition and generate song text for Suno"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("compose requires composition name")
         
-        composition_name = args[0]
+        composition_name = expression[1]
         if composition_name not in self.compositions:
             raise RuntimeError(f"Composition '{composition_name}' not defined")
         
         composition = self.compositions[composition_name]
-        print(f"🎵 Composing: {composition_name}")
-        print(f"📊 Structure: {composition.structure}")
+        logger.info("🎵 Composing: %s", composition_name)
+        logger.info("📊 Structure: %s", composition.structure)
         
         # Generate song text for Suno
         song_text = self._generate_suno_text(composition)
         
-        print("\n" + "="*60)
-        print("🎤 SONG TEXT FOR SUNO")
-        print("="*60)
-        print(song_text)
-        print("="*60)
+        if logger.isEnabledFor(logging.INFO):
+            separator = "=" * 60
+            logger.info("\n%s\n🎤 SONG TEXT FOR SUNO\n%s\n%s\n%s",
+                        separator, separator, song_text, separator)
         
         return {"status": "composed", "composition": composition_name, "song_text": song_text}
     
     def _generate_suno_text(self, composition) -> str:
         """Generate song text in Suno format based on composition"""
+        cached = self._suno_cache.get(id(composition))
+        if cached is not None and cached[0] is composition:
+            return cached[1]
+        song_text = self._build_suno_text(composition)
+        self._suno_cache[id(composition)] = (composition, song_text)
+        return song_text
+    
+    def _build_suno_text(self, composition) -> str:
+        """Build the Suno song text for a composition (uncached)"""
         # Get the leitmotif from composition
         leitmotif_name = None
         if hasattr(composition, 'structure') and 'leitmotif' in composition.structure:
@@ -718,46 +926,40 @@ class MOTIFInterpreter:
     
     def _motif_to_lyrics(self, motif) -> str:
         """Convert motif to lyrical text"""
+        # Motifs are not modified once defined, so the text depends only on
+        # the node itself
+        cached = self._lyrics_cache.get(id(motif))
+        if cached is not None and cached[0] is motif:
+            return cached[1]
+        lyrics = self._build_lyrics(motif)
+        self._lyrics_cache[id(motif)] = (motif, lyrics)
+        return lyrics
+    
+    def _build_lyrics(self, motif) -> str:
+        """Build the lyrical text for a motif (uncached)"""
         if not hasattr(motif, 'components'):
             return "No motif content found"
         
-        components = motif.components
-        archetypes = []
-        metaphors = []
-        
-        # Extract archetypes and metaphors
-        for key, value in components.items():
-            if 'archetype' in str(key).lower():
-                if isinstance(value, list):
-                    archetypes.extend([str(v) for v in value])
-                else:
-                    archetypes.append(str(value))
-            elif 'metaphor' in str(key).lower():
-                if isinstance(value, list):
-                    metaphors.extend([str(v) for v in value])
-                else:
-                    metaphors.append(str(value))
+        # Extracted by _define_motif
+        archetypes = motif.archetypes
+        metaphors = motif.metaphors
         
         # Clean up archetypes and metaphors (remove brackets and quotes)
-        clean_archetypes = []
-        for arch in archetypes:
-            if isinstance(arch, str):
-                clean_arch = arch.replace("'", "").replace("[", "").replace("]", "").replace(",", " ").strip()
-                # Split by spaces and add individual words
-                words = clean_arch.split()
-                for word in words:
-                    if word and word not in clean_archetypes:
-                        clean_archetypes.append(word)
-        
-        clean_metaphors = []
-        for meta in metaphors:
-            if isinstance(meta, str):
-                clean_meta = meta.replace("'", "").replace("[", "").replace("]", "").replace(",", " ").strip()
-                # Split by spaces and add individual words
-                words = clean_meta.split()
-                for word in words:
-                    if word and word not in clean_metaphors:
-                        clean_metaphors.append(word)
+        # dict.fromkeys keeps first-seen order with O(1) duplicate checks
+        clean_archetypes = list(dict.fromkeys(
+            word
+            for arch in archetypes if isinstance(arch, str)
+            # Split by spaces and add individual words
+            for word in arch.translate(_BRACKET_TABLE).split()
+        ))
+        
+        # dict.fromkeys keeps first-seen order with O(1) duplicate checks
+        clean_metaphors = list(dict.fromkeys(
+            word
+            for meta in metaphors if isinstance(meta, str)
+            # Split by spaces and add individual words
+            for word in meta.translate(_BRACKET_TABLE).split()
+        ))
         
         # Generate poetic lines based on archetypes and metaphors
         lines = []
@@ -830,54 +1032,54 @@ class MOTIFInterpreter:
         
         return "\n".join(lines[:4])  # Limit to 4 lines per section
     
-    def _execute_motif(self, args: List[Any]) -> Any:
+    def _execute_motif(self, expression: List[Any]) -> Any:
         """Execute motif"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("execute-motif requires motif name")
         
-        motif_name = args[0]
+        motif_name = expression[1]
         if motif_name not in self.motifs:
             raise RuntimeError(f"Motif '{motif_name}' not defined")
         
         motif = self.motifs[motif_name]
-        print(f"🎼 Executing motif: {motif_name}")
-        print(f"🧠 Components: {motif.components}")
+        logger.info("🎼 Executing motif: %s", motif_name)
+        logger.info("🧠 Components: %s", motif.components)
         
         return {"status": "executed", "motif": motif_name}
     
-    def _generate_emotion(self, args: List[Any]) -> Any:
+    def _generate_emotion(self, expression: List[Any]) -> Any:
         """Generate emotion"""
-        if len(args) < 2:
+        if len(expression) < 3:
             raise RuntimeError("generate-emotion requires emotion name and intensity")
         
-        emotion_name = args[0]
-        intensity = args[1]
+        emotion_name = expression[1]
+        intensity = expression[2]
         
-        print(f"💭 Generating emotion: {emotion_name} (intensity: {intensity})")
+        logger.info("💭 Generating emotion: %s (intensity: %s)", emotion_name, intensity)
         
         return {"status": "generated", "emotion": emotion_name, "intensity": intensity}
     
-    def _apply_metaphor(self, args: List[Any]) -> Any:
+    def _apply_metaphor(self, expression: List[Any]) -> Any:
         """Apply metaphor"""
-        if len(args) < 3:
+        if len(expression) < 4:
             raise RuntimeError("apply-metaphor requires metaphor name, source, and target")
         
-        metaphor_name = args[0]
-        source = args[1]
-        target = args[2]
+        metaphor_name = expression[1]
+        source = expression[2]
+        target = expression[3]
         
-        print(f"🔗 Applying metaphor: {metaphor_name} ({source} -> {target})")
+        logger.info("🔗 Applying metaphor: %s (%s -> %s)", metaphor_name, source, target)
         
         return {"status": "applied", "metaphor": metaphor_name}
     
-    def _if_emotional_state(self, args: List[Any]) -> Any:
+    def _if_emotional_state(self, expression: List[Any]) -> Any:
         """Conditional emotional logic"""
-        if len(args) < 3:
+        if len(expression) < 4:
             raise RuntimeError("if-emotional-state requires condition, then, and else")
         
-        condition = self._evaluate(args[0])
-        then_expr = args[1]
-        else_expr = args[2]
+        condition = self._evaluate(expression[1])
+        then_expr = expression[2]
+        else_expr = expression[3]
         
         # Simple condition evaluation (would be more sophisticated in real implementation)
         if condition:
@@ -885,13 +1087,13 @@ class MOTIFInterpreter:
         else:
             return self._evaluate(else_expr)
     
-    def _while_emotional_state(self, args: List[Any]) -> Any:
+    def _while_emotional_state(self, expression: List[Any]) -> Any:
         """Iterative emotional building"""
-        if len(args) < 2:
+        if len(expression) < 3:
             raise RuntimeError("while-emotional-state requires condition and body")
         
-        condition = args[0]
-        body = args[1] if isinstance(args[1], list) else [args[1]]
+        condition = expression[1]
+        body = expression[2] if isinstance(expression[2], list) else [expression[2]]
         
         result = None
         while self._evaluate(condition):
@@ -900,56 +1102,46 @@ class MOTIFInterpreter:
         
         return result
     
-    def _listener_state(self, args: List[Any]) -> Any:
+    def _listener_state(self, expression: List[Any]) -> Any:
         """Get listener state"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("listener-state requires a state name")
         
-        state_name = args[0]
-        
-        # Mock listener state (would be more sophisticated in real implementation)
-        mock_states = {
-            "melancholy": True,
-            "joy": False,
-            "nostalgia": True,
-            "despair": False
-        }
-        
-        return mock_states.get(state_name, False)
+        return self._MOCK_STATES.get(expression[1], False)
     
-    def _predict_emotional_triggers(self, args: List[Any]) -> Any:
+    def _predict_emotional_triggers(self, expression: List[Any]) -> Any:
         """Predict emotional triggers using ML"""
-        if len(args) < 2:
+        if len(expression) < 3:
             raise RuntimeError("predict-emotional-triggers requires target emotion and context")
         
-        target_emotion = args[0]
-        context = args[1]
+        target_emotion = expression[1]
+        context = expression[2]
         
-        print(f"🤖 Predicting emotional triggers for: {target_emotion}")
-        print(f"🌍 Context: {context}")
+        logger.info("🤖 Predicting emotional triggers for: %s", target_emotion)
+        logger.info("🌍 Context: %s", context)
         
         # Mock ML prediction (would integrate with actual ML models)
         predicted_triggers = ["night", "silence", "distance", "memory"]
         
         return {"status": "predicted", "triggers": predicted_triggers}
     
-    def _optimize_for_impact(self, args: List[Any]) -> Any:
+    def _optimize_for_impact(self, expression: List[Any]) -> Any:
         """Optimize composition for emotional impact"""
-        if len(args) < 2:
+        if len(expression) < 3:
             raise RuntimeError("optimize-for-impact requires composition name and target emotion")
         
-        composition_name = args[0]
-        target_emotion = args[1]
+        composition_name = expression[1]
+        target_emotion = expression[2]
         
-        print(f"⚡ Optimizing {composition_name} for {target_emotion}")
+        logger.info("⚡ Optimizing %s for %s", composition_name, target_emotion)
         
         return {"status": "optimized", "composition": composition_name, "target": target_emotion}
     
-    def _analyze_context(self, args: List[Any]) -> Any:
+    def _analyze_context(self, expression: List[Any]) -> Any:
         """Analyze current context"""
-        context_types = args if args else ["political", "cultural", "temporal"]
+        context_types = expression[1:] if len(expression) > 1 else ["political", "cultural", "temporal"]
         
-        print(f"🔍 Analyzing context: {context_types}")
+        logger.info("🔍 Analyzing context: %s", context_types)
         
         # Mock context analysis
         analysis = {
@@ -960,35 +1152,35 @@ class MOTIFInterpreter:
         
         return {"status": "analyzed", "context": analysis}
     
-    def _generate_seed_words(self, args: List[Any]) -> Any:
+    def _generate_seed_words(self, expression: List[Any]) -> Any:
         """Generate seed words for emotional impact"""
-        if len(args) < 3:
+        if len(expression) < 4:
             raise RuntimeError("generate-seed-words requires emotion, intensity, and context")
         
-        emotion = args[0]
-        intensity = args[1]
-        context = args[2]
+        emotion = expression[1]
+        intensity = expression[2]
+        context = expression[3]
         
-        print(f"🌱 Generating seed words for {emotion} (intensity: {intensity})")
+        logger.info("🌱 Generating seed words for %s (intensity: %s)", emotion, intensity)
         
         # Mock seed word generation
         seed_words = ["hammer", "void", "echo", "resonance"]
         
         return {"status": "generated", "seed_words": seed_words}
     
-    def _define_context(self, args: List[Any]) -> Any:
+    def _define_context(self, expression: List[Any]) -> Any:
         """Define context"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-context requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         properties = {}
         
         # Parse properties
-        for i in range(1, len(args), 2):
-            if i + 1 < len(args):
-                prop_name = args[i]
-                prop_value = args[i + 1]
+        for i in range(2, len(expression), 2):
+            if i + 1 < len(expression):
+                prop_name = expression[i]
+                prop_value = expression[i + 1]
                 # Handle case where prop_name is a list
                 if isinstance(prop_name, list) and len(prop_name) > 0:
                     prop_name_str = prop_name[0]
@@ -996,41 +1188,172 @@ class MOTIFInterpreter:
                 elif isinstance(prop_name, str):
                     properties[prop_name] = prop_value
         
+        if type(name) is str:
+            name = sys.intern(name)
         context = {"name": name, "properties": properties}
         self.context[name] = context
         return context
     
-    def _define_seed_words(self, args: List[Any]) -> Any:
+    def _define_seed_words(self, expression: List[Any]) -> Any:
         """Define seed words"""
-        if len(args) < 1:
+        if len(expression) < 2:
             raise RuntimeError("define-seed-words requires at least a name")
         
-        name = args[0]
+        name = expression[1]
         # For now, just store the name and return mock seed words
         seed_words = ["night", "silence", "distance", "memory"]
         
-        self.symbols[name] = seed_words
+        self._store("symbols", name, seed_words)
         return {"name": name, "words": seed_words}
 
 
+class Node(ABC):
+    """A MOTIF expression lowered for direct interpretation
+    
+    lower_motif() turns the nested lists from parse_motif() into nodes with
+    their operator already resolved, so interpreting a node is one method
+    call instead of type tests and a dispatch lookup.
+    """
+    __slots__ = ()
+    
+    @abstractmethod
+    def interpret(self, interp: MOTIFInterpreter) -> Any:
+        """Evaluate this node on interp and return its value"""
+
+
+class LiteralNode(Node):
+    """A number, or any other value that evaluates to itself"""
+    __slots__ = ('value',)
+    
+    def __init__(self, value: Any):
+        self.value = value
+    
+    def interpret(self, interp: MOTIFInterpreter) -> Any:
+        return self.value
+
+
+class SymbolNode(Node):
+    """A symbol reference"""
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def interpret(self, interp: MOTIFInterpreter) -> Any:
+        return interp._evaluate_symbol(self.name)
+
+
+class FormNode(Node):
+    """A form whose handler takes the raw form, e.g. the define-* forms"""
+    __slots__ = ('handler', 'expression')
+    
+    def __init__(self, handler: Callable[[MOTIFInterpreter, List[Any]], Any], expression: List[Any]):
+        self.handler = handler
+        self.expression = expression
+    
+    def interpret(self, interp: MOTIFInterpreter) -> Any:
+        return self.handler(interp, self.expression)
+
+
+class IfNode(Node):
+    """if-emotional-state with its condition and branches lowered"""
+    __slots__ = ('condition', 'then_node', 'else_node')
+    
+    def __init__(self, condition: Node, then_node: Node, else_node: Node):
+        self.condition = condition
+        self.then_node = then_node
+        self.else_node = else_node
+    
+    def interpret(self, interp: MOTIFInterpreter) -> Any:
+        if self.condition.interpret(interp):
+            return self.then_node.interpret(interp)
+        return self.else_node.interpret(interp)
+
+
+class WhileNode(Node):
+    """while-emotional-state with its condition and body steps lowered"""
+    __slots__ = ('condition', 'body')
+    
+    def __init__(self, condition: Node, body: Tuple[Node, ...]):
+        self.condition = condition
+        self.body = body
+    
+    def interpret(self, interp: MOTIFInterpreter) -> Any:
+        result = None
+        while self.condition.interpret(interp):
+            for node in self.body:
+                result = node.interpret(interp)
+        return result
+
+
+class ProgramNode(Node):
+    """A whole program: its top-level nodes, evaluated in order"""
+    __slots__ = ('body',)
+    
+    def __init__(self, body: Tuple[Node, ...]):
+        self.body = body
+    
+    def interpret(self, interp: MOTIFInterpreter) -> Any:
+        result = None
+        for node in self.body:
+            result = node.interpret(interp)
+        return result
+
+
+# Operator -> unbound handler, resolved once for lowering
+_HANDLERS = {operator: getattr(MOTIFInterpreter, name)
+             for operator, name in MOTIFInterpreter._DISPATCH_NAMES.items()}
+
+
+def _lower(expression: Any) -> Node:
+    """Lower one parsed expression into a Node"""
+    if isinstance(expression, list):
+        if not expression:
+            return LiteralNode(None)
+        operator = expression[0]
+        if operator == "if-emotional-state" and len(expression) >= 4:
+            return IfNode(_lower(expression[1]), _lower(expression[2]), _lower(expression[3]))
+        if operator == "while-emotional-state" and len(expression) >= 3:
+            # As in _while_emotional_state, a list body is a list of steps
+            body = expression[2] if isinstance(expression[2], list) else [expression[2]]
+            return WhileNode(_lower(expression[1]), tuple(_lower(step) for step in body))
+        handler = _HANDLERS.get(operator) if isinstance(operator, str) else None
+        if handler is None:
+            # Unknown operators still fail when reached, not while lowering
+            handler = MOTIFInterpreter._evaluate_list
+        return FormNode(handler, expression)
+    if isinstance(expression, str):
+        return SymbolNode(expression)
+    return LiteralNode(expression)
+
+
+def lower_motif(ast: List[Any]) -> ProgramNode:
+    """Lower a parse_motif() AST into nodes for direct interpretation"""
+    return ProgramNode(tuple(_lower(expression) for expression in ast))
+
+
 def parse_motif(code: str) -> List[Any]:
     """Parse MOTIF code into AST"""
     lexer = MOTIFLexer(code)
-    tokens = lexer.tokenize()
-    parser = MOTIFParser(tokens)
+    tokens = lexer.scan()
+    parser = MOTIFParser(tokens, code)
     return parser.parse()
 
 
+def interpret_motif_ast(ast: List[Any]) -> Any:
+    """Interpret an already parsed MOTIF AST"""
+    interpreter = MOTIFInterpreter()
+    return lower_motif(ast).interpret(interpreter)
+
+
 def interpret_motif(code: str) -> Any:
     """Parse and interpret MOTIF code"""
-    ast = parse_motif(code)
-    interpreter = MOTIFInterpreter()
-    return interpreter.interpret(ast)
+    return interpret_motif_ast(parse_motif(code))
 
 
 # Example usage
 if __name__ == "__main__":
-    import sys
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     
     if len(sys.argv) > 1:
         # Read from file
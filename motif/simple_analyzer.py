@@ -13,6 +13,8 @@ from collections import Counter
 @dataclass
 class EmotionalPattern:
     """Represents an emotional pattern found in song text"""
+    __slots__ = ('emotion', 'intensity', 'keywords', 'context')
+    
     emotion: str
     intensity: float
     keywords: List[str]
@@ -22,6 +24,8 @@ class EmotionalPattern:
 @dataclass
 class Archetype:
     """Represents an archetype found in song text"""
+    __slots__ = ('name', 'emotional_weight', 'frequency', 'context')
+    
     name: str
     emotional_weight: float
     frequency: int
@@ -31,6 +35,8 @@ class Archetype:
 @dataclass
 class Metaphor:
     """Represents a metaphor found in song text"""
+    __slots__ = ('source', 'target', 'emotional_multiplier', 'confidence')
+    
     source: str
     target: str
     emotional_multiplier: float
@@ -4,35 +4,46 @@ Analyzes song lyrics and extracts emotional patterns, archetypes, and metaphors
 to generate MOTIF code.
 """
 
+import io
 import re
+import sys
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 from collections import Counter
 import nltk
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-from nltk.tag import pos_tag
-
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
 
+# Download required NLTK data (words are split with _WORD_RE, so only the
+# stopword corpus is needed)
 try:
     nltk.data.find('corpora/stopwords')
 except LookupError:
     nltk.download('stopwords')
 
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger')
+# Runs of letters and digits. Stands in for nltk.word_tokenize: its
+# punctuation tokens never matched a keyword, and hyphenated words are now
+# split into their parts
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+# "%.1f" renderings of 0.1 .. 2.0 in tenths, keyed by the float itself (0.0
+# is left out since it would also match -0.0). Archetype weights are
+# count / 10 and metaphor multipliers 1.2, so generated code rarely needs a
+# real format call
+_TENTHS = {i / 10: f"{i / 10:.1f}" for i in range(1, 21)}
+
+
+def _format_tenths(value: float) -> str:
+    """Format value with one decimal, like f"{value:.1f}" """
+    text = _TENTHS.get(value)
+    return text if text is not None else f"{value:.1f}"
 
 
 @dataclass
 class EmotionalPattern:
     """Represents an emotional pattern found in song text"""
+    __slots__ = ('emotion', 'intensity', 'keywords', 'context')
+    
     emotion: str
     intensity: float
     keywords: List[str]
@@ -42,6 +53,8 @@ class EmotionalPattern:
 @dataclass
 class Archetype:
     """Represents an archetype found in song text"""
+    __slots__ = ('name', 'emotional_weight', 'frequency', 'context')
+    
     name: str
     emotional_weight: float
     frequency: int
@@ -51,6 +64,8 @@ class Archetype:
 @dataclass
 class Metaphor:
     """Represents a metaphor found in song text"""
+    __slots__ = ('source', 'target', 'emotional_multiplier', 'confidence')
+    
     source: str
     target: str
     emotional_multiplier: float
@@ -60,11 +75,22 @@ class Metaphor:
 class SongAnalyzer:
     """Analyzes song lyrics and extracts MOTIF components"""
     
+    # Section markers like [Verse 1]; no newlines inside the brackets
+    _SECTION_MARKER_RE = re.compile(r'\[.*?\]')
+    
+    # Marker keyword -> structure section, checked in order
+    _SECTION_KEYWORDS = (
+        ('verse', 'verses'), ('куплет', 'verses'),
+        ('chorus', 'choruses'), ('припев', 'choruses'),
+        ('bridge', 'bridges'), ('мост', 'bridges'),
+        ('outro', 'outros'), ('концовка', 'outros'),
+    )
+    
     def __init__(self):
         try:
-            self.stop_words = set(stopwords.words('english'))
+            self.stop_words = frozenset(stopwords.words('english'))
         except:
-            self.stop_words = set()
+            self.stop_words = frozenset()
         
         # Emotional keyword mappings (English and Russian)
         self.emotion_keywords = {
@@ -129,6 +155,33 @@ class SongAnalyzer:
             (r'(\w+)\s+на\s+(\w+)', 'metaphor'),
             (r'(\w+)\s+в\s+(\w+)', 'metaphor')
         ]
+        
+        # Keyword lists become frozensets for O(1) `word in keywords` checks
+        self.emotion_keywords = {emotion: frozenset(keywords)
+                                 for emotion, keywords in self.emotion_keywords.items()}
+        self.archetype_patterns = {archetype: frozenset(patterns)
+                                   for archetype, patterns in self.archetype_patterns.items()}
+        
+        # Compiled once rather than looked up in re's cache on every call
+        self._metaphor_res = [(re.compile(pattern, re.IGNORECASE), metaphor_type)
+                              for pattern, metaphor_type in self.metaphor_patterns]
+        
+        # One reverse index over both tables and languages: word ->
+        # (emotions, archetypes) listing it, in table order. Extraction is a
+        # single pass over the words instead of one per category
+        self._keyword_index = self._build_keyword_index()
+    
+    def _build_keyword_index(self) -> Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """Map every emotion or archetype keyword to the categories listing it"""
+        emotions: Dict[str, List[str]] = {}
+        archetypes: Dict[str, List[str]] = {}
+        for index, table in ((emotions, self.emotion_keywords),
+                             (archetypes, self.archetype_patterns)):
+            for category, keywords in table.items():
+                for keyword in keywords:
+                    index.setdefault(keyword, []).append(category)
+        return {word: (tuple(emotions.get(word, ())), tuple(archetypes.get(word, ())))
+                for word in emotions.keys() | archetypes.keys()}
     
     def analyze_song(self, song_text: str) -> Dict[str, Any]:
         """Analyze song text and extract MOTIF components"""
@@ -136,13 +189,17 @@ class SongAnalyzer:
         cleaned_text = self._clean_text(song_text)
         
         # Extract song structure
-        structure = self._extract_structure(song_text)
+        structure = self._extract_structure(song_text.split('\n'))
+        
+        # Tokenize and count once for both keyword extractors
+        words = _WORD_RE.findall(cleaned_text)
+        word_freq = Counter(words)
         
         # Extract emotional patterns
-        emotions = self._extract_emotions(cleaned_text)
+        emotions = self._extract_emotions(cleaned_text, words)
         
         # Extract archetypes
-        archetypes = self._extract_archetypes(cleaned_text)
+        archetypes = self._extract_archetypes(cleaned_text, word_freq)
         
         # Extract metaphors
         metaphors = self._extract_metaphors(cleaned_text)
@@ -159,21 +216,25 @@ class SongAnalyzer:
             'original_text': song_text
         }
     
+    def analyze_many(self, songs: List[str]) -> List[Dict[str, Any]]:
+        """Analyze several songs, sharing this analyzer's keyword indexes
+        
+        The tables and reverse indexes are built once in __init__, so a
+        batch should go through one analyzer rather than one per song.
+        """
+        return [self.analyze_song(song) for song in songs]
+    
     def _clean_text(self, text: str) -> str:
         """Clean and preprocess song text"""
         # Remove section markers like [Verse], [Chorus], etc.
-        text = re.sub(r'\[.*?\]', '', text)
+        text = self._SECTION_MARKER_RE.sub('', text)
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        return text.strip()
+        # Convert to lowercase; split() + join collapses whitespace runs to
+        # single spaces and strips the ends in one C-level pass
+        return ' '.join(text.lower().split())
     
-    def _extract_structure(self, text: str) -> Dict[str, List[str]]:
-        """Extract song structure from text"""
+    def _extract_structure(self, lines: List[str]) -> Dict[str, List[str]]:
+        """Extract song structure from the lines of a song"""
         structure = {
             'verses': [],
             'choruses': [],
@@ -181,7 +242,6 @@ class SongAnalyzer:
             'outros': []
         }
         
-        lines = text.split('\n')
         current_section = None
         current_content = []
         
@@ -198,14 +258,10 @@ class SongAnalyzer:
                 
                 # Start new section
                 section_name = line[1:-1].lower()
-                if 'verse' in section_name or 'куплет' in section_name:
-                    current_section = 'verses'
-                elif 'chorus' in section_name or 'припев' in section_name:
-                    current_section = 'choruses'
-                elif 'bridge' in section_name or 'мост' in section_name:
-                    current_section = 'bridges'
-                elif 'outro' in section_name or 'концовка' in section_name:
-                    current_section = 'outros'
+                for keyword, section in self._SECTION_KEYWORDS:
+                    if keyword in section_name:
+                        current_section = section
+                        break
                 else:
                     current_section = 'verses'  # Default
                 
@@ -219,13 +275,20 @@ class SongAnalyzer:
         
         return structure
     
-    def _extract_emotions(self, text: str) -> List[EmotionalPattern]:
-        """Extract emotional patterns from text"""
+    def _extract_emotions(self, text: str, words: List[str]) -> List[EmotionalPattern]:
+        """Extract emotional patterns from text, given its words"""
         emotions = []
-        words = word_tokenize(text)
+        
+        found: Dict[str, List[str]] = {}
+        keyword_index = self._keyword_index
+        for word in words:
+            entry = keyword_index.get(word)
+            if entry is not None:
+                for emotion in entry[0]:
+                    found.setdefault(emotion, []).append(word)
         
         for emotion, keywords in self.emotion_keywords.items():
-            matches = [word for word in words if word in keywords]
+            matches = found.get(emotion)
             if matches:
                 intensity = min(len(matches) / len(keywords), 1.0)
                 emotions.append(EmotionalPattern(
@@ -237,16 +300,23 @@ class SongAnalyzer:
         
         return emotions
     
-    def _extract_archetypes(self, text: str) -> List[Archetype]:
-        """Extract archetypes from text"""
+    def _extract_archetypes(self, text: str, word_freq: Counter) -> List[Archetype]:
+        """Extract archetypes from text, given its word counts"""
         archetypes = []
-        words = word_tokenize(text)
-        word_freq = Counter(words)
         
-        for archetype, patterns in self.archetype_patterns.items():
-            matches = [word for word in words if word in patterns]
-            if matches:
-                frequency = sum(word_freq[word] for word in matches)
+        # Each occurrence of a matching word adds that word's frequency, so
+        # a distinct word contributes count * count
+        frequencies: Dict[str, int] = {}
+        keyword_index = self._keyword_index
+        for word, count in word_freq.items():
+            entry = keyword_index.get(word)
+            if entry is not None:
+                for archetype in entry[1]:
+                    frequencies[archetype] = frequencies.get(archetype, 0) + count * count
+        
+        for archetype in self.archetype_patterns:
+            frequency = frequencies.get(archetype)
+            if frequency:
                 emotional_weight = min(frequency / 10.0, 1.0)
                 
                 archetypes.append(Archetype(
@@ -262,9 +332,8 @@ class SongAnalyzer:
         """Extract metaphors from text"""
         metaphors = []
         
-        for pattern, metaphor_type in self.metaphor_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern, metaphor_type in self._metaphor_res:
+            for match in pattern.finditer(text):
                 source = match.group(1)
                 target = match.group(2)
                 
@@ -307,6 +376,21 @@ class SongAnalyzer:
 class MotifGenerator:
     """Generates MOTIF code from analyzed song data"""
     
+    # Definition blocks, each ending with its newline
+    _ARCHETYPE_TEMPLATE = ("(define-archetype {name}\n"
+                           "    (emotional-weight {weight})\n"
+                           "    (cultural-context universal))\n")
+    _METAPHOR_TEMPLATE = ("(define-metaphor {name}\n"
+                          "    (source {source})\n"
+                          "    (target {target})\n"
+                          "    (emotional-multiplier {multiplier})\n"
+                          "    (cultural-resonance high))\n")
+    _MOTIF_TEMPLATE = ("(define-motif {name}\n"
+                       "{components}"
+                       "    (intensity {intensity})\n"
+                       "    (repetition-pattern {repetition}))\n"
+                       "\n")
+    
     def __init__(self):
         self.context_counter = 0
         self.motif_counter = 0
@@ -315,160 +399,142 @@ class MotifGenerator:
     
     def generate_motif_code(self, analysis: Dict[str, Any]) -> str:
         """Generate MOTIF code from song analysis"""
-        lines = []
+        # Every helper writes whole newline-terminated blocks into one buffer
+        buf = io.StringIO()
         
         # Add header comment
-        lines.append(f";; MOTIF Program: Generated from Song Analysis")
-        lines.append(f";; Theme: {analysis['theme']}")
-        lines.append(f";; Generated by MOTIF Reverse Compiler")
-        lines.append("")
+        buf.write(";; MOTIF Program: Generated from Song Analysis\n"
+                  f";; Theme: {analysis['theme']}\n"
+                  ";; Generated by MOTIF Reverse Compiler\n"
+                  "\n")
         
         # Generate context
-        context_name = self._generate_context(analysis, lines)
+        context_name = self._generate_context(analysis, buf)
         
         # Generate archetypes
-        archetype_names = self._generate_archetypes(analysis['archetypes'], lines)
+        archetype_names = self._generate_archetypes(analysis['archetypes'], buf)
         
         # Generate metaphors
-        metaphor_names = self._generate_metaphors(analysis['metaphors'], lines)
+        metaphor_names = self._generate_metaphors(analysis['metaphors'], buf)
         
         # Generate motifs for each section
-        motif_names = self._generate_motifs(analysis, archetype_names, metaphor_names, lines)
+        motif_names = self._generate_motifs(analysis, archetype_names, metaphor_names, buf)
         
         # Generate leitmotif
-        leitmotif_name = self._generate_leitmotif(motif_names, lines)
+        leitmotif_name = self._generate_leitmotif(motif_names, buf)
         
         # Generate composition
-        composition_name = self._generate_composition(leitmotif_name, analysis['theme'], lines)
+        composition_name = self._generate_composition(leitmotif_name, analysis['theme'], buf)
         
-        # Add compose command
-        lines.append(f"(compose {composition_name})")
+        # Add compose command (the last line has no trailing newline)
+        buf.write("(compose ")
+        buf.write(composition_name)
+        buf.write(")")
         
-        return '\n'.join(lines)
+        return buf.getvalue()
     
-    def _generate_context(self, analysis: Dict[str, Any], lines: List[str]) -> str:
+    def _generate_context(self, analysis: Dict[str, Any], buf: io.StringIO) -> str:
         """Generate context definition"""
         self.context_counter += 1
-        context_name = f"generated-context-{self.context_counter}"
+        context_name = sys.intern(f"generated-context-{self.context_counter}")
         
-        lines.append(f"(define-context {context_name}")
-        lines.append(f"    (cultural-background universal)")
-        lines.append(f"    (emotional-theme {analysis['theme']})")
-        lines.append(f"    (temporal-context timeless))")
-        lines.append("")
+        buf.write(f"(define-context {context_name}\n"
+                  "    (cultural-background universal)\n"
+                  f"    (emotional-theme {analysis['theme']})\n"
+                  "    (temporal-context timeless))\n"
+                  "\n")
         
         return context_name
     
-    def _generate_archetypes(self, archetypes: List[Archetype], lines: List[str]) -> List[str]:
+    def _generate_archetypes(self, archetypes: List[Archetype], buf: io.StringIO) -> List[str]:
         """Generate archetype definitions"""
-        archetype_names = []
+        selected = archetypes[:10]  # Limit to top 10
+        archetype_names = self._next_names("archetype", "archetype_counter", len(selected))
         
-        for archetype in archetypes[:10]:  # Limit to top 10
-            self.archetype_counter += 1
-            archetype_name = f"archetype-{self.archetype_counter}"
-            archetype_names.append(archetype_name)
-            
-            lines.append(f"(define-archetype {archetype_name}")
-            lines.append(f"    (emotional-weight {archetype.emotional_weight:.1f})")
-            lines.append(f"    (cultural-context universal))")
+        buf.write("".join(self._ARCHETYPE_TEMPLATE.format(name=name,
+                                                          weight=_format_tenths(archetype.emotional_weight))
+                          for name, archetype in zip(archetype_names, selected)))
         
         if archetype_names:
-            lines.append("")
+            buf.write("\n")
         
         return archetype_names
     
-    def _generate_metaphors(self, metaphors: List[Metaphor], lines: List[str]) -> List[str]:
+    def _generate_metaphors(self, metaphors: List[Metaphor], buf: io.StringIO) -> List[str]:
         """Generate metaphor definitions"""
-        metaphor_names = []
-        
-        for metaphor in metaphors[:5]:  # Limit to top 5
-            self.metaphor_counter += 1
-            metaphor_name = f"metaphor-{self.metaphor_counter}"
-            metaphor_names.append(metaphor_name)
-            
-            lines.append(f"(define-metaphor {metaphor_name}")
-            lines.append(f"    (source {metaphor.source})")
-            lines.append(f"    (target {metaphor.target})")
-            lines.append(f"    (emotional-multiplier {metaphor.emotional_multiplier:.1f})")
-            lines.append(f"    (cultural-resonance high))")
+        selected = metaphors[:5]  # Limit to top 5
+        metaphor_names = self._next_names("metaphor", "metaphor_counter", len(selected))
+        
+        buf.write("".join(self._METAPHOR_TEMPLATE.format(name=name, source=metaphor.source,
+                                                         target=metaphor.target,
+                                                         multiplier=_format_tenths(metaphor.emotional_multiplier))
+                          for name, metaphor in zip(metaphor_names, selected)))
         
         if metaphor_names:
-            lines.append("")
+            buf.write("\n")
         
         return metaphor_names
     
     def _generate_motifs(self, analysis: Dict[str, Any], archetype_names: List[str], 
-                        metaphor_names: List[str], lines: List[str]) -> List[str]:
+                        metaphor_names: List[str], buf: io.StringIO) -> List[str]:
         """Generate motif definitions for each song section"""
         motif_names = []
         structure = analysis['structure']
+        target = f"    (emotional-target {analysis['theme']})\n"
         
-        # Generate motifs for verses
-        for i, verse in enumerate(structure['verses']):
-            self.motif_counter += 1
-            motif_name = f"verse-motif-{self.motif_counter}"
-            motif_names.append(motif_name)
-            
-            lines.append(f"(define-motif {motif_name}")
-            lines.append(f"    (archetypes ({' '.join(archetype_names[:3])}))")
-            if metaphor_names:
-                lines.append(f"    (metaphors ({' '.join(metaphor_names[:2])}))")
-            lines.append(f"    (emotional-target {analysis['theme']})")
-            lines.append(f"    (intensity 0.7)")
-            lines.append(f"    (repetition-pattern gentle))")
-            lines.append("")
-        
-        # Generate motifs for choruses
-        for i, chorus in enumerate(structure['choruses']):
-            self.motif_counter += 1
-            motif_name = f"chorus-motif-{self.motif_counter}"
-            motif_names.append(motif_name)
-            
-            lines.append(f"(define-motif {motif_name}")
-            lines.append(f"    (archetypes ({' '.join(archetype_names[:4])}))")
-            if metaphor_names:
-                lines.append(f"    (metaphors ({' '.join(metaphor_names)}))")
-            lines.append(f"    (emotional-target {analysis['theme']})")
-            lines.append(f"    (intensity 0.9)")
-            lines.append(f"    (repetition-pattern building))")
-            lines.append("")
-        
-        # Generate motifs for bridges
-        for i, bridge in enumerate(structure['bridges']):
-            self.motif_counter += 1
-            motif_name = f"bridge-motif-{self.motif_counter}"
-            motif_names.append(motif_name)
-            
-            lines.append(f"(define-motif {motif_name}")
-            lines.append(f"    (archetypes ({' '.join(archetype_names[:2])}))")
-            lines.append(f"    (emotional-target {analysis['theme']})")
-            lines.append(f"    (intensity 0.6)")
-            lines.append(f"    (repetition-pattern single))")
-            lines.append("")
+        verse_metaphors = chorus_metaphors = ""
+        if metaphor_names:
+            verse_metaphors = f"    (metaphors ({' '.join(metaphor_names[:2])}))\n"
+            chorus_metaphors = f"    (metaphors ({' '.join(metaphor_names)}))\n"
+        
+        # (section, name prefix, archetype count, metaphors line, intensity, repetition)
+        sections = (
+            ('verses', "verse-motif", 3, verse_metaphors, "0.7", "gentle"),
+            ('choruses', "chorus-motif", 4, chorus_metaphors, "0.9", "building"),
+            ('bridges', "bridge-motif", 2, "", "0.6", "single"),
+        )
+        
+        # Generate motifs for verses, then choruses, then bridges
+        for section, prefix, archetype_count, metaphors, intensity, repetition in sections:
+            names = self._next_names(prefix, "motif_counter", len(structure[section]))
+            # The component lines are the same for every motif of a section
+            components = (f"    (archetypes ({' '.join(archetype_names[:archetype_count])}))\n"
+                          + metaphors + target)
+            buf.write("".join(self._MOTIF_TEMPLATE.format(name=name, components=components,
+                                                          intensity=intensity, repetition=repetition)
+                              for name in names))
+            motif_names.extend(names)
         
         return motif_names
     
-    def _generate_leitmotif(self, motif_names: List[str], lines: List[str]) -> str:
+    def _next_names(self, prefix: str, counter: str, count: int) -> List[str]:
+        """Number the next count definitions of a kind, advancing its counter"""
+        first = getattr(self, counter) + 1
+        setattr(self, counter, first + count - 1)
+        # Interned: each name is formatted into several later definitions
+        return [sys.intern(f"{prefix}-{number}") for number in range(first, first + count)]
+    
+    def _generate_leitmotif(self, motif_names: List[str], buf: io.StringIO) -> str:
         """Generate leitmotif definition"""
         leitmotif_name = "main-theme"
         
-        lines.append(f"(define-leitmotif {leitmotif_name}")
-        lines.append(f"    (motifs ({' '.join(motif_names)}))")
-        lines.append(f"    (repetition infinite)")
-        lines.append(f"    (emotional-progression building))")
-        lines.append("")
+        buf.write(f"(define-leitmotif {leitmotif_name}\n"
+                  f"    (motifs ({' '.join(motif_names)}))\n"
+                  "    (repetition infinite)\n"
+                  "    (emotional-progression building))\n"
+                  "\n")
         
         return leitmotif_name
     
-    def _generate_composition(self, leitmotif_name: str, theme: str, lines: List[str]) -> str:
+    def _generate_composition(self, leitmotif_name: str, theme: str, buf: io.StringIO) -> str:
         """Generate composition definition"""
         composition_name = "generated-composition"
         
-        lines.append(f"(define-composition {composition_name}")
-        lines.append(f"    (leitmotif {leitmotif_name})")
-        lines.append(f"    (structure verse-chorus-bridge)")
-        lines.append(f"    (target-emotion {theme}))")
-        lines.append("")
+        buf.write(f"(define-composition {composition_name}\n"
+                  f"    (leitmotif {leitmotif_name})\n"
+                  "    (structure verse-chorus-bridge)\n"
+                  f"    (target-emotion {theme}))\n"
+                  "\n")
         
         return composition_name
 
@@ -487,6 +553,17 @@ def analyze_song_to_motif(song_text: str) -> str:
     return motif_code
 
 
+def analyze_songs_to_motif(song_texts: List[str]) -> List[str]:
+    """Convert several song texts to MOTIF code, one program per song
+    
+    One analyzer serves the whole batch, so the stopword corpus is read and
+    the keyword indexes are built once rather than once per song.
+    """
+    analyses = SongAnalyzer().analyze_many(song_texts)
+    # A fresh generator per song numbers each program as analyze_song_to_motif would
+    return [MotifGenerator().generate_motif_code(analysis) for analysis in analyses]
+
+
 # Example usage
 if __name__ == "__main__":
     sample_song = """
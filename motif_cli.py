@@ -4,218 +4,227 @@ Final MOTIF Absurdist Mathematical Poem Generator
 Generates the exact text: "А и Б сидели на трубе..." using MOTIF concepts
 """
 
-class AbsurdistMotifGenerator:
-    """Generates the exact absurdist mathematical poem using MOTIF concepts"""
-    
-    def __init__(self):
-        # Define archetypes for the poem
-        self.archetypes = {
-            'A': {'emotional-weight': 0.8, 'cultural-context': 'russian-childhood'},
-            'B': {'emotional-weight': 0.8, 'cultural-context': 'russian-childhood'},
-            'pipe': {'emotional-weight': 0.7, 'cultural-context': 'russian-childhood'},
-            'x-squared': {'emotional-weight': 0.9, 'cultural-context': 'mathematical'},
-            'exponential': {'emotional-weight': 0.9, 'cultural-context': 'mathematical'},
-            'yesterday': {'emotional-weight': 0.6, 'cultural-context': 'temporal'},
-            'long-time': {'emotional-weight': 0.6, 'cultural-context': 'temporal'},
-            'unshaven': {'emotional-weight': 0.7, 'cultural-context': 'masculine'},
-            'brutal': {'emotional-weight': 0.8, 'cultural-context': 'masculine'}
-        }
-        
-        # Define metaphors
-        self.metaphors = {
-            'character-mathematical': {
-                'source': 'B',
-                'target': 'x-squared',
-                'emotional-multiplier': 1.3,
-                'meaning': 'character becoming mathematical function'
-            },
-            'mathematical-personality': {
-                'source': 'x-squared',
-                'target': 'mathematical-function',
-                'emotional-multiplier': 1.4,
-                'meaning': 'mathematical function having personality traits'
-            }
-        }
-        
-        # Define motifs with exact text content
-        self.motifs = {
-            'line1': {
-                'archetypes': ['A', 'B', 'pipe'],
-                'emotional-target': 'playful-nostalgia',
-                'intensity': 0.6,
-                'text-content': 'А и Б сидели на трубе'
-            },
-            'line2': {
-                'archetypes': ['A', 'long-time'],
-                'emotional-target': 'stability',
-                'intensity': 0.5,
-                'text-content': 'А сидел уже давно и плотно'
-            },
-            'line3': {
-                'archetypes': ['B', 'yesterday'],
-                'emotional-target': 'dynamic-change',
-                'intensity': 0.6,
-                'text-content': 'Б подсел только вчера'
-            },
-            'line4': {
-                'archetypes': ['B', 'x-squared'],
-                'metaphors': ['character-mathematical'],
-                'emotional-target': 'mathematical-absurdity',
-                'intensity': 0.8,
-                'text-content': 'Но плотнее А на Икс в квадрате'
-            },
-            'line5': {
-                'archetypes': ['x-squared'],
-                'emotional-target': 'mathematical-awe',
-                'intensity': 0.9,
-                'text-content': 'На Икс в квадрате'
-            },
-            'line6': {
-                'archetypes': ['exponential'],
-                'emotional-target': 'mathematical-intensity',
-                'intensity': 0.9,
-                'text-content': 'экспоненциален'
-            },
-            'line7': {
-                'archetypes': ['x-squared'],
-                'emotional-target': 'mathematical-repetition',
-                'intensity': 0.8,
-                'text-content': 'Икс в квадрате'
-            },
-            'line8': {
-                'archetypes': ['unshaven', 'brutal'],
-                'metaphors': ['mathematical-personality'],
-                'emotional-target': 'absurd-humor',
-                'intensity': 0.7,
-                'text-content': 'не брит и брутален'
-            },
-            'line9': {
-                'archetypes': ['exponential'],
-                'emotional-target': 'escalating-intensity',
-                'intensity': 1.0,
-                'text-content': 'экспоненциален'
-            },
-            'repetition1': {
-                'archetypes': ['exponential'],
-                'emotional-target': 'escalating-intensity',
-                'intensity': 1.0,
-                'text-content': 'экспоненциален'
-            },
-            'repetition2': {
-                'archetypes': ['exponential'],
-                'emotional-target': 'escalating-intensity',
-                'intensity': 1.0,
-                'text-content': 'экспоненциален'
-            },
-            'repetition3': {
-                'archetypes': ['exponential'],
-                'emotional-target': 'escalating-intensity',
-                'intensity': 1.0,
-                'text-content': 'экспоненциален'
-            }
-        }
-        
-        # Define leitmotif structure
-        self.leitmotif = {
-            'name': 'main-theme',
-            'motifs': [
-                'line1',
-                'line2', 
-                'line3',
-                'line4',
-                'line5',
-                'line6',
-                'line7',
-                'line8',
-                'line9',
-                'repetition1',
-                'repetition2',
-                'repetition3'
-            ],
-            'emotional-progression': 'building-absurd',
-            'repetition': 'single'
-        }
-    
-    def execute_motif(self, motif_name: str) -> str:
-        """Execute a specific motif and return its text content"""
-        if motif_name in self.motifs:
-            motif = self.motifs[motif_name]
-            print(f"🎼 Executing motif: {motif_name}")
-            print(f"🧠 Archetypes: {motif['archetypes']}")
-            print(f"🎯 Emotional target: {motif['emotional-target']}")
-            print(f"⚡ Intensity: {motif['intensity']}")
-            print(f"📝 Generated text: {motif['text-content']}")
-            print()
-            return motif['text-content']
-        else:
-            return ""
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+
+# The refrain word; every motif and poem line repeating it shares this object
+_EXP = sys.intern("экспоненциален")
+
+# Archetypes for the poem
+ARCHETYPES: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    'A': {'emotional-weight': 0.8, 'cultural-context': 'russian-childhood'},
+    'B': {'emotional-weight': 0.8, 'cultural-context': 'russian-childhood'},
+    'pipe': {'emotional-weight': 0.7, 'cultural-context': 'russian-childhood'},
+    'x-squared': {'emotional-weight': 0.9, 'cultural-context': 'mathematical'},
+    'exponential': {'emotional-weight': 0.9, 'cultural-context': 'mathematical'},
+    'yesterday': {'emotional-weight': 0.6, 'cultural-context': 'temporal'},
+    'long-time': {'emotional-weight': 0.6, 'cultural-context': 'temporal'},
+    'unshaven': {'emotional-weight': 0.7, 'cultural-context': 'masculine'},
+    'brutal': {'emotional-weight': 0.8, 'cultural-context': 'masculine'}
+})
+
+# Metaphors
+METAPHORS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    'character-mathematical': {
+        'source': 'B',
+        'target': 'x-squared',
+        'emotional-multiplier': 1.3,
+        'meaning': 'character becoming mathematical function'
+    },
+    'mathematical-personality': {
+        'source': 'x-squared',
+        'target': 'mathematical-function',
+        'emotional-multiplier': 1.4,
+        'meaning': 'mathematical function having personality traits'
+    }
+})
+
+# Motifs with exact text content, one row per motif:
+# (name, archetypes, metaphors, emotional target, intensity, text, count)
+# A count above 1 plays the text as one run-length encoded repetition
+_MOTIF_SPEC = (
+    ('line1', ('A', 'B', 'pipe'), (), 'playful-nostalgia', 0.6, 'А и Б сидели на трубе', 1),
+    ('line2', ('A', 'long-time'), (), 'stability', 0.5, 'А сидел уже давно и плотно', 1),
+    ('line3', ('B', 'yesterday'), (), 'dynamic-change', 0.6, 'Б подсел только вчера', 1),
+    ('line4', ('B', 'x-squared'), ('character-mathematical',), 'mathematical-absurdity', 0.8,
+     'Но плотнее А на Икс в квадрате', 1),
+    ('line5', ('x-squared',), (), 'mathematical-awe', 0.9, 'На Икс в квадрате', 1),
+    ('line6', ('exponential',), (), 'mathematical-intensity', 0.9, _EXP, 1),
+    ('line7', ('x-squared',), (), 'mathematical-repetition', 0.8, 'Икс в квадрате', 1),
+    ('line8', ('unshaven', 'brutal'), ('mathematical-personality',), 'absurd-humor', 0.7,
+     'не брит и брутален', 1),
+    ('line9', ('exponential',), (), 'escalating-intensity', 1.0, _EXP, 1),
+    ('exponential-buildup', ('exponential',), (), 'escalating-intensity', 1.0, _EXP, 3),
+)
+
+MOTIFS: Mapping[str, Dict[str, Any]] = MappingProxyType({
+    name: {
+        'archetypes': archetypes,
+        'metaphors': metaphors,
+        'emotional-target': target,
+        'intensity': intensity,
+        'text-content': text,
+        'count': count
+    }
+    for name, archetypes, metaphors, target, intensity, text, count in _MOTIF_SPEC
+})
+
+# Order in which the leitmotif plays the motifs
+_LEITMOTIF_ORDER = (
+    'line1', 'line2', 'line3', 'line4', 'line5', 'line6',
+    'line7', 'line8', 'line9', 'exponential-buildup',
+)
+
+# Leitmotif structure
+LEITMOTIF = MappingProxyType({
+    'name': 'main-theme',
+    'motifs': _LEITMOTIF_ORDER,
+    'emotional-progression': 'building-absurd',
+    'repetition': 'single'
+})
+
+def _motif_banner(name: str) -> str:
+    """Format the execution trace printed for one motif"""
+    motif = MOTIFS[name]
+    archetypes = list(motif['archetypes'])
+    count = motif['count']
+    if count == 1:
+        heading = f"🎼 Executing motif: {name}"
+        text = motif['text-content']
+    else:
+        heading = f"🔄 Executing repetition motif: {name}"
+        text = f"{motif['text-content']} (×{count})"
+    return (
+        f"{heading}\n"
+        f"🧠 Archetypes: {archetypes}\n"
+        f"🎯 Emotional target: {motif['emotional-target']}\n"
+        f"⚡ Intensity: {motif['intensity']}\n"
+        f"📝 Generated text: {text}\n"
+        "\n"
+    )
+
+
+def _motif_lines(name: str) -> tuple:
+    """Poem lines of one motif; a repeated run is set off by a blank line"""
+    motif = MOTIFS[name]
+    count = motif['count']
+    if count == 1:
+        return (motif['text-content'],)
+    return ("",) + (motif['text-content'],) * count
+
+
+# Each motif's execution trace is static, so it is formatted once here and
+# execute_motif() emits it with a single write
+_MOTIF_BANNERS = {name: _motif_banner(name) for name in MOTIFS}
+
+# The poem is fixed, so its text is joined once at import rather than
+# reassembled on every compose_poem() call
+_POEM_LINES = tuple(line for name in _LEITMOTIF_ORDER for line in _motif_lines(name))
+POEM_TEXT = "\n".join(_POEM_LINES)
+# Pre-encoded for the --quiet path, written to the binary buffer directly
+_POEM_BYTES = f"{POEM_TEXT}\n".encode("utf-8")
+
+# The composition result; every field is constant, so it is built once and
+# shared read-only
+COMPOSITION = MappingProxyType({
+    'status': 'composed',
+    'composition': 'absurdist-poem',
+    'song_text': POEM_TEXT,
+    'leitmotif': LEITMOTIF['name'],
+    'target-emotion': 'amused-mathematical-confusion'
+})
+
+
+# Static banners, assembled once and emitted with a single write each
+_RULE = "=" * 60
+_PROGRAM_BANNER = (
+    "🎵 MOTIF Program: Absurdist Mathematical Poem\n"
+    "🎯 Target HCR: Universal Human Consciousness with Mathematical Background\n"
+    "🎪 Goal: Generate exact text with mathematical absurdity\n"
+    f"{_RULE}\n"
+    "\n"
+)
+_SONG_TEXT_BANNER = f"{_RULE}\n🎤 SONG TEXT FOR SUNO\n{_RULE}\n"
+
+# compose_poem()'s whole trace, resolved in leitmotif order ahead of time so
+# the verbose path does no per-motif lookups
+_COMPOSE_TRACE = _PROGRAM_BANNER + "".join(_MOTIF_BANNERS[name] for name in _LEITMOTIF_ORDER)
+
+
+def execute_motif(motif_name: str, verbose: bool = False) -> str:
+    """Execute a specific motif and return its text content"""
+    motif = MOTIFS.get(motif_name)
+    if motif is None:
+        return ""
+    if verbose:
+        sys.stdout.write(_MOTIF_BANNERS[motif_name])
+    return motif['text-content']
+
+
+def compose_poem(verbose: bool = False) -> str:
+    """Compose the complete absurdist mathematical poem
     
-    def compose_poem(self) -> str:
-        """Compose the complete absurdist mathematical poem"""
-        print("🎵 MOTIF Program: Absurdist Mathematical Poem")
-        print("🎯 Target HCR: Universal Human Consciousness with Mathematical Background")
-        print("🎪 Goal: Generate exact text with mathematical absurdity")
-        print("="*60)
-        print()
-        
-        # Execute each motif in sequence
-        poem_lines = []
-        
-        for motif_name in self.leitmotif['motifs']:
-            text = self.execute_motif(motif_name)
-            if text:
-                poem_lines.append(text)
-        
-        # Add the repetition section
-        print("🔄 Executing repetition motif: exponential-buildup")
-        print("🧠 Archetypes: ['exponential']")
-        print("🎯 Emotional target: escalating-intensity")
-        print("⚡ Intensity: 1.0")
-        print("📝 Generated text: экспоненциален (×3)")
-        print()
-        
-        # Add empty line before repetition
-        poem_lines.append("")
-        
-        # Add the final repetitions
-        poem_lines.extend(["экспоненциален"] * 3)
-        
-        return "\n".join(poem_lines)
+    The text itself is the precomputed POEM_TEXT; verbose only controls
+    whether the motif execution trace is printed along the way.
+    """
+    # Kept as plain Python on purpose: the text is one str.join done at
+    # import, and a JIT such as Numba handles str building in object
+    # mode, which is slower than the interpreter and adds compile time
+    if not verbose:
+        return POEM_TEXT
     
-    def generate_composition(self) -> dict:
-        """Generate the complete composition"""
+    # Equivalent to executing each motif in sequence
+    sys.stdout.write(_COMPOSE_TRACE)
+    return POEM_TEXT
+
+
+def generate_composition(verbose: bool = False) -> Mapping:
+    """Generate the complete composition"""
+    if verbose:
         print("🎵 Composing: absurdist-poem")
         print("📊 Structure: leitmotif-driven with exact text reproduction")
         print()
-        
-        poem_text = self.compose_poem()
-        
-        return {
-            'status': 'composed',
-            'composition': 'absurdist-poem',
-            'song_text': poem_text,
-            'leitmotif': self.leitmotif['name'],
-            'target-emotion': 'amused-mathematical-confusion'
-        }
+        # Only the execution trace is wanted; the text is in COMPOSITION
+        compose_poem(verbose)
+    
+    return COMPOSITION
+
 
 def main():
     """Main function"""
-    generator = AbsurdistMotifGenerator()
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate the MOTIF absurdist mathematical poem")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="print only the song text, without the execution trace")
+    # Other arguments (such as the README's example script path) are ignored
+    args, _ = parser.parse_known_args()
     
     # Generate the composition
-    result = generator.generate_composition()
+    result = generate_composition(verbose=not args.quiet)
+    
+    if args.quiet:
+        # A replaced stdout (redirect_stdout, StringIO capture) has no
+        # binary buffer to take the pre-encoded bytes
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is None:
+            sys.stdout.write(POEM_TEXT + "\n")
+        else:
+            sys.stdout.flush()
+            buffer.write(_POEM_BYTES)
+        return
     
-    # Display the final result
-    print("="*60)
-    print("🎤 SONG TEXT FOR SUNO")
-    print("="*60)
-    print(result['song_text'])
-    print("="*60)
-    print()
-    print("✅ MOTIF execution completed successfully!")
-    print(f"📊 Final result: {result['status']}")
-    print(f"🎵 Composition: {result['composition']}")
-    print(f"🎯 Target emotion: {result['target-emotion']}")
+    # Display the final result, assembled in memory and written at once
+    import io
+    buf = io.StringIO()
+    buf.write(_SONG_TEXT_BANNER)
+    buf.write(f"{result['song_text']}\n{_RULE}\n\n")
+    buf.write("✅ MOTIF execution completed successfully!\n")
+    buf.write(f"📊 Final result: {result['status']}\n")
+    buf.write(f"🎵 Composition: {result['composition']}\n")
+    buf.write(f"🎯 Target emotion: {result['target-emotion']}\n")
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     main()
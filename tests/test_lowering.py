@@ -0,0 +1,108 @@
+"""
+Checks that lowered programs (interpret_motif_ast) and compile_program()
+behave like MOTIFInterpreter.interpret on if/while control flow
+"""
+
+import unittest
+
+from motif.parser import MOTIFInterpreter, interpret_motif_ast, lower_motif, parse_motif
+
+
+_DEFINITIONS = """
+(define-archetype night (emotional-weight 0.9) (cultural-context universal))
+(define-archetype light (emotional-weight 0.6) (cultural-context universal))
+(define-motif core (archetypes (night light)) (emotional-target melancholy) (intensity 0.9))
+"""
+
+_IF_TRUE = _DEFINITIONS + """
+(if-emotional-state
+    (listener-state melancholy)
+    (define-archetype dusk (emotional-weight 0.5))
+    (define-archetype dawn (emotional-weight 0.4)))
+"""
+
+_IF_FALSE = _DEFINITIONS + """
+(if-emotional-state
+    (listener-state joy)
+    (define-archetype dusk (emotional-weight 0.5))
+    (execute-motif core))
+"""
+
+_WHILE_FALSE = _DEFINITIONS + """
+(while-emotional-state
+    (listener-state despair)
+    (define-archetype dusk (emotional-weight 0.5)))
+"""
+
+_WHILE_NESTED_IF = _DEFINITIONS + """
+(if-emotional-state
+    (listener-state nostalgia)
+    (while-emotional-state (listener-state joy) (execute-motif core))
+    (execute-motif core))
+"""
+
+# The mock listener states never change, so a loop with a true condition
+# runs until a body step fails; the steps before it must still take effect
+_WHILE_TRUE_FAILING_BODY = _DEFINITIONS + """
+(while-emotional-state
+    (listener-state melancholy)
+    ((define-archetype dusk (emotional-weight 0.5))
+     (if-emotional-state (listener-state joy) (execute-motif core) (undefined-operator))))
+"""
+
+
+def _interpreter_state(interp: MOTIFInterpreter) -> dict:
+    return {name: repr(getattr(interp, name))
+            for name in ("symbols", "archetypes", "metaphors", "motifs", "leitmotifs", "compositions")}
+
+
+class LoweringTest(unittest.TestCase):
+    """Lowered and compiled programs against the tree-walking interpreter"""
+
+    def assert_same_run(self, code: str) -> None:
+        ast = parse_motif(code)
+        walked = MOTIFInterpreter()
+        expected = walked.interpret(ast)
+
+        self.assertEqual(repr(interpret_motif_ast(ast)), repr(expected))
+
+        lowered = MOTIFInterpreter()
+        self.assertEqual(repr(lower_motif(ast).interpret(lowered)), repr(expected))
+        self.assertEqual(_interpreter_state(lowered), _interpreter_state(walked))
+
+        compiled = MOTIFInterpreter()
+        self.assertEqual(repr(compiled.compile_program(ast)()), repr(expected))
+        self.assertEqual(_interpreter_state(compiled), _interpreter_state(walked))
+
+    def test_if_true_branch(self):
+        self.assert_same_run(_IF_TRUE)
+
+    def test_if_false_branch(self):
+        self.assert_same_run(_IF_FALSE)
+
+    def test_while_false_condition(self):
+        self.assert_same_run(_WHILE_FALSE)
+
+    def test_while_nested_in_if(self):
+        self.assert_same_run(_WHILE_NESTED_IF)
+
+    def test_while_body_error(self):
+        ast = parse_motif(_WHILE_TRUE_FAILING_BODY)
+        walked = MOTIFInterpreter()
+        with self.assertRaises(RuntimeError) as expected:
+            walked.interpret(ast)
+
+        with self.assertRaises(RuntimeError) as raised:
+            interpret_motif_ast(ast)
+        self.assertEqual(str(raised.exception), str(expected.exception))
+
+        lowered = MOTIFInterpreter()
+        with self.assertRaises(RuntimeError) as raised:
+            lower_motif(ast).interpret(lowered)
+        self.assertEqual(str(raised.exception), str(expected.exception))
+        self.assertIn("dusk", lowered.archetypes)
+        self.assertEqual(_interpreter_state(lowered), _interpreter_state(walked))
+
+
+if __name__ == "__main__":
+    unittest.main()
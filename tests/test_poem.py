@@ -0,0 +1,22 @@
+"""
+Checks for the absurdist poem generator in the top-level motif_cli.py
+"""
+
+import sys
+import unittest
+
+import motif_cli
+
+
+class PoemAssemblyTest(unittest.TestCase):
+    """Poem text assembly stays plain Python"""
+
+    def test_compose_poem_does_not_import_numba(self):
+        # String assembly is a str.join done at import; a JIT such as Numba
+        # would only be slower here, so it must not creep in
+        self.assertEqual(motif_cli.compose_poem(), motif_cli.POEM_TEXT)
+        self.assertNotIn("numba", sys.modules)
+
+
+if __name__ == "__main__":
+    unittest.main()